@@ -1,57 +1,648 @@
 # Copyright (c) 2026 Jony Ahammad
 # License: MIT
 
-from datetime import datetime, date
-from typing import List, Dict
-
-def read_data(filename: str) -> List[Dict]:
-    """Reads the CSV file and returns a list of dictionaries with parsed data."""
-    data = []
-    with open(filename, "r", encoding="utf-8") as f:
-        next(f)  # skip header
-        for line in f:
-            parts = line.strip().split(";")
-            if len(parts) < 4:
-                continue  # skip invalid lines
-            timestamp, consumption, production, temperature = parts[:4]
-
-            # Clean timestamp (remove milliseconds and timezone)
-            ts_clean = timestamp.split(".")[0].split("+")[0]
-            dt = datetime.strptime(ts_clean, "%Y-%m-%dT%H:%M:%S")
-
-            data.append({
-                "date": dt.date(),
-                "consumption": float(consumption.replace(",", ".")),
-                "production": float(production.replace(",", ".")),
-                "temperature": float(temperature.replace(",", "."))
-            })
+import argparse
+import json
+import mmap
+import os
+import sys
+import time
+from array import array
+from collections import OrderedDict
+from datetime import datetime, date, timedelta
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from itertools import chain
+from typing import List, Dict, Iterator, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+from urllib.request import urlopen
+
+# The helpers shared by the tasks are in task_common.py at the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from task_common import (
+    CPROFILE_ENV, PROFILE_ENV, BlockHashes, ReportWriter, complete_end, format_decimal_fi, iter_fields,
+    load_many, profiler_from_env
+)
+
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+PROFILER = profiler_from_env()
+
+CACHE_SUFFIX = ".cache"
+
+def save_cache(filename: str, columns: Dict[str, array], stat: os.stat_result,
+               hashes: BlockHashes) -> None:
+    """
+    Writes the parsed columns next to the CSV file (<filename>.cache): one JSON
+    header line describing the source file as it was when parsed (stat), the
+    number of bytes parsed (offset, always the end of a complete line) and
+    the block hashes of those bytes, then the raw bytes of each column.
+    """
+    header = {
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "offset": hashes.size,
+        "blocks": hashes.hashes,
+        "byteorder": sys.byteorder,
+        "rows": len(next(iter(columns.values()))),
+        "columns": [[name, column.typecode] for name, column in columns.items()],
+    }
+    temp_name = filename + CACHE_SUFFIX + ".tmp"
+    with open(temp_name, "wb") as f:
+        f.write(json.dumps(header).encode("utf-8") + b"\n")
+        for column in columns.values():
+            column.tofile(f)
+    os.replace(temp_name, filename + CACHE_SUFFIX)
+
+def load_cache(filename: str) -> Optional[Tuple[Dict[str, array], Dict]]:
+    """
+    Returns the cached columns of a CSV file and the cache header, or None if
+    there is no usable cache.
+    """
+    try:
+        with open(filename + CACHE_SUFFIX, "rb") as f:
+            header = json.loads(f.readline())
+            if header["byteorder"] != sys.byteorder or "blocks" not in header:
+                return None
+            columns = {}
+            for name, typecode in header["columns"]:
+                column = array(typecode)
+                column.fromfile(f, header["rows"])
+                columns[name] = column
+    except (OSError, ValueError, KeyError, EOFError):
+        return None
+    return columns, header
+
+def empty_data() -> Dict[str, array]:
+    """Returns empty data columns."""
+    return {
+        "hour": array("q"),
+        "consumption": array("d"),
+        "production": array("d"),
+        "temperature": array("d"),
+    }
+
+@PROFILER.measure("parse_rows")
+def parse_rows(lines: Iterator[List[bytes]], data: Dict[str, array]) -> None:
+    """Parses CSV lines (split into bytes fields) and appends them to the data columns."""
+    hours = data["hour"]
+    consumptions = data["consumption"]
+    productions = data["production"]
+    temperatures = data["temperature"]
+    for parts in lines:
+        if len(parts) < 4:
+            continue  # skip invalid lines
+        timestamp, consumption, production, temperature = parts[:4]
+
+        # fromisoformat keeps the +02:00/+03:00 offset; the reports
+        # group by the local (wall-clock) day and hour
+        dt = datetime.fromisoformat(timestamp.decode())
+
+        hours.append((dt.toordinal() - EPOCH_ORDINAL) * 24 + dt.hour)
+        consumptions.append(float(consumption.replace(b",", b".")))
+        productions.append(float(production.replace(b",", b".")))
+        temperatures.append(float(temperature.replace(b",", b".")))
+
+def read_appended(filename: str, data: Dict[str, array], source: Dict, size: int) -> bool:
+    """
+    Parses the complete lines of a file after the bytes already read (source,
+    see load_data) into the data columns and adds them to the block hashes.
+    Rows of an incomplete last line added by read_pending are dropped first.
+    Returns whether lines were added.
+    """
+    hashes = source["hashes"]
+    for column in data.values():
+        del column[source["rows"]:]
+    start = hashes.size
+    end = complete_end(filename, start, size)
+    if end > start:
+        lines = iter_fields(filename, start, end)
+        if start == 0:
+            next(lines, None)  # skip header
+        parse_rows(lines, data)
+        hashes.extend(filename, end)
+    source["rows"] = len(data["hour"])
+    return end > start
+
+def read_pending(filename: str, data: Dict[str, array], source: Dict, size: int) -> None:
+    """
+    Parses a last line without a newline into the data columns. It may be only
+    partly written, so it is not counted as read (nor cached) until complete.
+    """
+    end = source["hashes"].size
+    if 0 < end < size:
+        try:
+            pending = empty_data()
+            parse_rows(iter_fields(filename, end, size), pending)
+        except ValueError:
+            pass  # the last line is not complete yet
+        else:
+            for key, column in pending.items():
+                data[key].extend(column)
+
+@PROFILER.measure("read_data", rows=lambda result, *args: len(result[0]["hour"]))
+def load_data(filename: str, use_cache: bool = True) -> Tuple[Dict[str, array], Dict]:
+    """
+    Reads the CSV file and returns the parsed data as columns, with the state
+    refresh_data needs to read only the rows appended later: {"hashes": the
+    BlockHashes of the complete lines read, "rows": the rows they hold}.
+    'hour' holds hours since 1970-01-01 (local time) and the other columns
+    hold one float per row in the same order.
+
+    With use_cache the columns are loaded from (or saved to) a binary cache file
+    next to the CSV. The cache covers the complete lines parsed so far and the
+    block hashes of those bytes: if the file is unchanged or has only grown,
+    just the new lines are parsed; if the first or last cached block was
+    rewritten, the whole file is parsed again.
+    """
+    stat = os.stat(filename)
+    data, hashes = empty_data(), BlockHashes()
+    if use_cache:
+        cached = load_cache(filename)
+        if cached is not None:
+            cached_data, header = cached
+            cached_hashes = BlockHashes(header["blocks"], header["offset"])
+            if ((header["size"], header["mtime_ns"]) == (stat.st_size, stat.st_mtime_ns)
+                    or cached_hashes.check(filename)):
+                data, hashes = cached_data, cached_hashes
+
+    source = {"hashes": hashes, "rows": len(data["hour"])}
+    if read_appended(filename, data, source, stat.st_size) and use_cache:
+        try:
+            save_cache(filename, data, stat, hashes)
+        except OSError:
+            pass  # the report works without a cache
+    read_pending(filename, data, source, stat.st_size)
+    return data, source
+
+def read_data(filename: str, use_cache: bool = True) -> Dict[str, array]:
+    """Reads the CSV file and returns the parsed data as columns (see load_data)."""
+    return load_data(filename, use_cache)[0]
+
+def read_many(filenames: List[str], limit: int = 8) -> Dict[str, array]:
+    """
+    Reads several CSV files concurrently (at most limit at a time, see
+    task_common.load_many) and joins their columns in time order.
+    """
+    data = empty_data()
+    for part in load_many(read_data, filenames, limit):
+        for key, column in part.items():
+            data[key].extend(column)
+    return sort_by_hour(data)
+
+def hour_order(hours: array, start: int = 0) -> Optional[List[int]]:
+    """
+    Returns the row numbers from start on sorted by hour (stable), or None if
+    those rows are in time order already, which is checked in one pass.
+    """
+    previous = hours[start] if start < len(hours) else 0
+    for hour in hours[start:]:
+        if hour < previous:
+            return sorted(range(start, len(hours)), key=hours.__getitem__)
+        previous = hour
+    return None
+
+def sort_by_hour(data: Dict[str, array]) -> Dict[str, array]:
+    """Returns the data columns with the rows in time order."""
+    order = hour_order(data["hour"])
+    if order is None:
+        return data
+    return {key: array(column.typecode, [column[i] for i in order])
+            for key, column in data.items()}
+
+def hour_to_date(hour: int) -> date:
+    """Converts hours since 1970-01-01 to a date."""
+    return date.fromordinal(EPOCH_ORDINAL + hour // 24)
+
+@PROFILER.measure("build_day_index", rows=lambda index, data: len(data["hour"]))
+def build_day_index(data: Dict[str, array]) -> Dict:
+    """
+    Builds cumulative sums of the data columns per day, starting from the
+    first day in the data. Entry i of each sum covers all days before
+    first_day + i, so any date range total is two lookups and a subtraction.
+    The last entry holds the totals of all rows. The CSV values have three
+    decimals (kWh) and one (temperature), so the sums are kept as exact
+    integers in thousandths and tenths.
+    """
+    index = {
+        "first_day": 0,
+        "consumption": array("q", [0, 0]),
+        "production": array("q", [0, 0]),
+        "temperature": array("q", [0, 0]),
+        "count": array("q", [0, 0]),
+        "data": data,
+        "in_order": True,  # the indexed rows of each day are contiguous in data
+    }
+    update_day_index(index, data)
+    return index
+
+def update_day_index(index: Dict, data: Dict[str, array]) -> None:
+    """
+    Adds the rows of data that are not in the index yet (appended rows) to it.
+    The rows do not have to be in time order; if a new row falls on a day
+    before the last indexed one, the whole index is rebuilt.
+    """
+    index["data"] = data
+    hours = data["hour"]
+    start = index["count"][-1]
+    if start >= len(hours):
+        return
+    order = hour_order(hours, start)
+    first_new_day = (hours[start] if order is None else hours[order[0]]) // 24
+    if start > 0 and first_new_day < index["first_day"] + len(index["count"]) - 2:
+        index.update(build_day_index(empty_data()))  # index every row again
+        index["data"] = data
+        start = 0
+        order = hour_order(hours)
+    if start == 0:
+        index["first_day"] = (hours[0] if order is None else hours[order[0]]) // 24
+
+    if order is None:
+        rows = zip(hours[start:], data["consumption"][start:],
+                   data["production"][start:], data["temperature"][start:])
+    else:
+        index["in_order"] = False
+        consumptions, productions, temperatures = data["consumption"], data["production"], data["temperature"]
+        rows = ((hours[i], consumptions[i], productions[i], temperatures[i]) for i in order)
+
+    # The last entry holds the running totals; it is appended again below
+    totals = [index["consumption"].pop(), index["production"].pop(), index["temperature"].pop()]
+    count = index["count"].pop()
+    current_day = index["first_day"] + len(index["count"]) - 1
+    for hour, consumption, production, temperature in rows:
+        day = hour // 24
+        while current_day < day:
+            index["consumption"].append(totals[0])
+            index["production"].append(totals[1])
+            index["temperature"].append(totals[2])
+            index["count"].append(count)
+            current_day += 1
+        totals[0] += round(consumption * 1000)
+        totals[1] += round(production * 1000)
+        totals[2] += round(temperature * 10)
+        count += 1
+    index["consumption"].append(totals[0])
+    index["production"].append(totals[1])
+    index["temperature"].append(totals[2])
+    index["count"].append(count)
+
+def unindex_rows(index: Dict, data: Dict[str, array], rows: int) -> None:
+    """
+    Removes the last data rows, from row number rows on, from the day index
+    (before they are dropped from data). If the index is not in time order,
+    or they are not on its last days, it is rebuilt from the other rows.
+    """
+    hours = data["hour"]
+    if not index["in_order"] or rows == 0 or min(hours[rows:]) < hours[rows - 1] // 24 * 24:
+        index.update(build_day_index({key: column[:rows] for key, column in data.items()}))
+        return
+    last = hours[rows - 1] // 24 - index["first_day"] + 1
+    for key, scale in (("consumption", 1000), ("production", 1000), ("temperature", 10)):
+        total = index[key][-1] - sum(round(value * scale) for value in data[key][rows:])
+        del index[key][last + 1:]
+        index[key][last] = total
+    del index["count"][last + 1:]
+    index["count"][last] = rows
+
+def refresh_data(filename: str, data: Dict[str, array], index: Dict,
+                 source: Dict) -> Tuple[Dict[str, array], Dict, Dict]:
+    """
+    Returns the data, day index and source state (see load_data) updated with
+    the rows appended to the file since they were read. Only the new lines are
+    parsed and hashed, into the columns already in memory; the cache file is
+    brought up to date by the next load_data. If the file was truncated or its
+    first or last read block rewritten, everything is read again.
+    """
+    size = os.path.getsize(filename)
+    if not source["hashes"].check(filename):
+        data, source = load_data(filename)
+        return data, build_day_index(data), source
+    if len(data["hour"]) > source["rows"]:
+        unindex_rows(index, data, source["rows"])  # the last line was incomplete
+    read_appended(filename, data, source, size)
+    read_pending(filename, data, source, size)
+    update_day_index(index, data)
+    return data, index, source
+
+def day_range(index: Dict, start_date: date, end_date: date) -> Tuple[int, int]:
+    """Returns the day index entries that bound the days start_date..end_date (inclusive)."""
+    last = len(index["count"]) - 1
+    start_day = start_date.toordinal() - EPOCH_ORDINAL - index["first_day"]
+    end_day = end_date.toordinal() - EPOCH_ORDINAL - index["first_day"] + 1
+    start = min(max(start_day, 0), last)
+    return start, min(max(end_day, start), last)
+
+def range_totals(index: Dict, start_date: date, end_date: date) -> Tuple[int, int, int, int]:
+    """
+    Returns the consumption and production sums (in thousandths), the
+    temperature sum (in tenths) and the row count of the days between start_date and
+    end_date (inclusive) in a day index.
+    """
+    start, end = day_range(index, start_date, end_date)
+    return (index["consumption"][end] - index["consumption"][start],
+            index["production"][end] - index["production"][start],
+            index["temperature"][end] - index["temperature"][start],
+            index["count"][end] - index["count"][start])
+
+def range_values(index: Dict, start_date: date, end_date: date, key: str) -> Iterator[float]:
+    """Yields the values of one data column for the days between the dates, in data order."""
+    start, end = day_range(index, start_date, end_date)
+    data, count = index["data"], index["count"]
+    if index["in_order"]:
+        return iter(data[key][count[start]:count[end]])
+    first, last = (index["first_day"] + start) * 24, (index["first_day"] + end) * 24
+    rows = zip(data["hour"][:count[-1]], data[key])
+    return (value for hour, value in rows if first <= hour < last)
+
+def values_sum(parts: List[Tuple], key: str) -> float:
+    """
+    Sums one data column over the (day index, start date, end date) ranges in
+    parts, adding the float values in data order like the row-by-row reports.
+    """
+    return sum(chain.from_iterable(range_values(*part, key) for part in parts))
+
+def summarize(index, start_date: date, end_date: date) -> Tuple[float, float, float]:
+    """
+    Returns total consumption, total production and average temperature
+    for the days between start_date and end_date (inclusive). index is a day
+    index or a SiteData (partitioned files of one site).
+
+    The exact sums decide the two-decimal report values, except when a value
+    lies exactly halfway between two hundredths (e.g. 250,835) or is zero: the
+    rounding (or the sign of -0,00) then depends on the float sum itself, so
+    that value is summed row by row and the report shows what the row-by-row
+    reports showed.
+    """
+    parts = [(index, start_date, end_date)] if isinstance(index, dict) else index.parts(start_date, end_date)
+    consumption = production = temperature_sum = count = 0
+    for part in parts:
+        totals = range_totals(*part)
+        consumption += totals[0]
+        production += totals[1]
+        temperature_sum += totals[2]
+        count += totals[3]
+    if not count:
+        return 0, 0, 0
+    if consumption % 10 == 5 or not consumption:
+        total_consumption = values_sum(parts, "consumption")
+    else:
+        total_consumption = consumption / 1000
+    if production % 10 == 5 or not production:
+        total_production = values_sum(parts, "production")
+    else:
+        total_production = production / 1000
+    # In hundredths the average is temperature_sum * 10 / count; a tie has a fraction of 1/2
+    if 2 * (temperature_sum * 10 % count) == count or not temperature_sum:
+        avg_temp = values_sum(parts, "temperature") / count
+    else:
+        avg_temp = temperature_sum / (10 * count)
+    return total_consumption, total_production, avg_temp
+
+def data_years(index) -> List[int]:
+    """Returns the years covered by a day index or a SiteData."""
+    if not isinstance(index, dict):
+        return index.years()
+    if not index["count"][-1]:
+        return []
+    first = hour_to_date(index["first_day"] * 24).year
+    last = hour_to_date((index["first_day"] + len(index["count"]) - 2) * 24).year
+    return list(range(first, last + 1))
+
+def years_label(years: List[int]) -> str:
+    """Returns '2025' for one year or '2024–2025' for several."""
+    if not years:
+        return "2025"
+    if len(years) == 1:
+        return str(years[0])
+    return f"{years[0]}–{years[-1]}"
+
+def month_offset(mm: mmap.mmap, start: int, key: bytes) -> int:
+    """
+    Returns the offset of the first line at or after start (a line start) whose
+    timestamp begins with a 'YYYY-MM' at or after key. The lines must be in
+    time order; the search reads only about log2(size) lines.
+    """
+    low, high = start, len(mm)
+    while low < high:
+        middle = (low + high) // 2
+        line_start = max(mm.rfind(b"\n", 0, middle) + 1, low)
+        if mm[line_start:line_start + len(key)] < key:
+            line_end = mm.find(b"\n", middle)
+            low = len(mm) if line_end < 0 else line_end + 1
+        else:
+            high = line_start
+    return low
+
+def read_month(filename: str, year: int, month: int) -> Dict[str, array]:
+    """Parses only the lines of one month from a time-ordered CSV file."""
+    with open(filename, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return empty_data()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            first_line = mm.find(b"\n") + 1 or size  # skip header
+            next_year, next_month = (year + 1, 1) if month == 12 else (year, month + 1)
+            start = month_offset(mm, first_line, b"%04d-%02d" % (year, month))
+            end = month_offset(mm, start, b"%04d-%02d" % (next_year, next_month))
+    data = empty_data()
+    parse_rows(iter_fields(filename, start, end), data)
     return data
 
-def show_main_menu() -> str:
+def month_bounds(year: int, month: int) -> Tuple[date, date]:
+    """Returns the first and last day of a month."""
+    month_start = date(year, month, 1)
+    month_end = (month_start + timedelta(days=31)).replace(day=1) - timedelta(days=1)
+    return month_start, month_end
+
+class PartitionStore:
+    """
+    Reads a directory of per-site, per-year files (<directory>/<site>/<year>.csv)
+    as site/year/month partitions. A partition is parsed only when a query
+    needs it, and only that month's lines are read (see month_offset). Once the
+    loaded partitions take more than memory_budget bytes, the least recently
+    used ones are dropped; a partition whose file has changed is read again.
+    """
+
+    def __init__(self, directory: str, memory_budget: int = 64 << 20):
+        self.directory = directory
+        self.memory_budget = memory_budget
+        self.partitions = OrderedDict()  # (site, year, month) -> (stat key, data, index, bytes)
+        self.memory = 0
+        self.loads = 0
+        self.evictions = 0
+
+    def sites(self) -> List[str]:
+        """Returns the site directories."""
+        return sorted(name for name in os.listdir(self.directory)
+                      if os.path.isdir(os.path.join(self.directory, name)))
+
+    def years(self, site: str) -> List[int]:
+        """Returns the years that have a file for a site."""
+        names = os.listdir(os.path.join(self.directory, site))
+        return sorted(int(name[:-4]) for name in names if name.endswith(".csv") and name[:-4].isdigit())
+
+    def filename(self, site: str, year: int) -> str:
+        return os.path.join(self.directory, site, f"{year}.csv")
+
+    def site(self, site: str) -> "SiteData":
+        """Returns the data of one site for the reports."""
+        if not os.path.isdir(os.path.join(self.directory, site)):
+            raise ValueError(f"Unknown site {site!r}")
+        return SiteData(self, site)
+
+    def partition(self, site: str, year: int, month: int) -> Dict:
+        """Returns the day index of one month, loading the partition if needed."""
+        key = (site, year, month)
+        filename = self.filename(site, year)
+        stat = os.stat(filename)
+        stat_key = (stat.st_size, stat.st_mtime_ns)
+        entry = self.partitions.get(key)
+        if entry is not None and entry[0] == stat_key:
+            self.partitions.move_to_end(key)
+            return entry[2]
+        if entry is not None:
+            del self.partitions[key]
+            self.memory -= entry[3]
+
+        data = read_month(filename, year, month)
+        index = build_day_index(data)
+        size = sum(column.itemsize * len(column)
+                   for columns in (data, index) for column in columns.values()
+                   if isinstance(column, array))
+        self.partitions[key] = (stat_key, data, index, size)
+        self.memory += size
+        self.loads += 1
+        while self.memory > self.memory_budget and len(self.partitions) > 1:
+            _, (_, _, _, evicted) = self.partitions.popitem(last=False)
+            self.memory -= evicted
+            self.evictions += 1
+        return index
+
+    def stats(self) -> Dict[str, int]:
+        """Returns the partition counters."""
+        return {
+            "partitions": len(self.partitions),
+            "memory": self.memory,
+            "memory_budget": self.memory_budget,
+            "loads": self.loads,
+            "evictions": self.evictions,
+        }
+
+class SiteData:
+    """The partitioned data of one site, used by the reports in place of a day index."""
+
+    def __init__(self, store: PartitionStore, site: str):
+        self.store = store
+        self.site = site
+
+    def years(self) -> List[int]:
+        return self.store.years(self.site)
+
+    def stat(self) -> tuple:
+        """Returns the sizes and modification times of the site's files."""
+        stats = [os.stat(self.store.filename(self.site, year)) for year in self.years()]
+        return tuple((stat.st_size, stat.st_mtime_ns) for stat in stats)
+
+    def parts(self, start_date: date, end_date: date) -> List[Tuple[Dict, date, date]]:
+        """
+        Returns the day index of each month partition between the dates with
+        the part of the range it covers, in time order. summarize() adds up
+        their exact sums, so the totals are the same as from one index of all
+        the files.
+        """
+        parts = []
+        years = set(self.years())
+        year, month = start_date.year, start_date.month
+        while (year, month) <= (end_date.year, end_date.month):
+            if year in years:
+                month_start, month_end = month_bounds(year, month)
+                index = self.store.partition(self.site, year, month)
+                parts.append((index, max(start_date, month_start), min(end_date, month_end)))
+            year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+        return parts
+
+class ReportCache:
+    """
+    LRU cache of report lines keyed by (report type, parameters, data version).
+    invalidate() is called when the data is reloaded; hits, misses and
+    evictions are counted for stats().
+    """
+
+    def __init__(self, max_size: int = 128):
+        self.max_size = max_size
+        self.entries = OrderedDict()
+        self.version = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, report: str, params: tuple, build) -> List[str]:
+        """Returns the cached lines, or calls build() and caches its result."""
+        key = (report, params, self.version)
+        lines = self.entries.get(key)
+        if lines is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return lines
+        self.misses += 1
+        lines = build()
+        self.entries[key] = lines
+        if len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+        return lines
+
+    def invalidate(self) -> None:
+        """Drops all results; the data they were built from has changed."""
+        self.version += 1
+        self.entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Returns the cache counters."""
+        return {
+            "size": len(self.entries),
+            "max_size": self.max_size,
+            "version": self.version,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+def show_main_menu(years: List[int] = None) -> str:
     """Displays the main menu and returns the user's choice."""
     print("\nChoose a report type:")
     print("1) Daily summary for a date range")
     print("2) Monthly summary for one month")
-    print("3) Full year 2025 summary")
+    print(f"3) Full year {years_label(years or [])} summary")
     print("4) Exit")
     return input("Enter choice (1-4): ").strip()
 
-def create_daily_report(data: List[Dict]) -> List[str]:
+def ask_year(index) -> Optional[int]:
+    """Asks for the year when the data covers more than one year."""
+    years = data_years(index)
+    if len(years) <= 1:
+        return None
+    return int(input(f"Enter year ({years[0]}–{years[-1]}): ").strip())
+
+def create_daily_report(index, cache: ReportCache = None) -> List[str]:
     """Builds a daily report for a selected date range."""
     start_str = input("Enter start date (dd.mm.yyyy): ").strip()
     end_str = input("Enter end date (dd.mm.yyyy): ").strip()
+    if cache is None:
+        return daily_report(index, start_str, end_str)
+    return cache.get("daily", (start_str, end_str), lambda: daily_report(index, start_str, end_str))
+
+@PROFILER.measure("daily_report", rows=lambda lines, *args: len(lines))
+def daily_report(index, start_str: str, end_str: str) -> List[str]:
+    """Builds a daily report for the date range start_str–end_str (dd.mm.yyyy)."""
     start_date = datetime.strptime(start_str, "%d.%m.%Y").date()
     end_date = datetime.strptime(end_str, "%d.%m.%Y").date()
 
-    filtered = [row for row in data if start_date <= row["date"] <= end_date]
-    total_consumption = sum(row["consumption"] for row in filtered)
-    total_production = sum(row["production"] for row in filtered)
-    avg_temp = sum(row["temperature"] for row in filtered) / len(filtered) if filtered else 0
+    total_consumption, total_production, avg_temp = summarize(index, start_date, end_date)
 
     # Format numbers
-    total_consumption_str = f"{total_consumption:.2f}".replace(".", ",")
-    total_production_str = f"{total_production:.2f}".replace(".", ",")
-    avg_temp_str = f"{avg_temp:.2f}".replace(".", ",")
+    total_consumption_str = format_decimal_fi(total_consumption)
+    total_production_str = format_decimal_fi(total_production)
+    avg_temp_str = format_decimal_fi(avg_temp)
 
     lines = [
         "-----------------------------------------------------",
@@ -62,19 +653,28 @@ def create_daily_report(data: List[Dict]) -> List[str]:
     ]
     return lines
 
-def create_monthly_report(data: List[Dict]) -> List[str]:
-    """Builds a monthly summary report for a selected month."""
+def create_monthly_report(index, cache: ReportCache = None) -> List[str]:
+    """Builds a monthly summary report for a selected month (and year, if there are several)."""
+    year = ask_year(index)
     month = int(input("Enter month number (1–12): ").strip())
-    filtered = [row for row in data if row["date"].month == month]
-    total_consumption = sum(row["consumption"] for row in filtered)
-    total_production = sum(row["production"] for row in filtered)
-    avg_temp = sum(row["temperature"] for row in filtered) / len(filtered) if filtered else 0
+    if cache is None:
+        return monthly_report(index, month, year)
+    return cache.get("monthly", (month, year), lambda: monthly_report(index, month, year))
 
-    month_name = date(2025, month, 1).strftime("%B")
+@PROFILER.measure("monthly_report", rows=lambda lines, *args: len(lines))
+def monthly_report(index, month: int, year: int = None) -> List[str]:
+    """Builds a monthly summary report for the given month (1-12), by default of the first year."""
+    if year is None:
+        years = data_years(index)
+        year = years[0] if years else 2025
+    month_start, month_end = month_bounds(year, month)
+    total_consumption, total_production, avg_temp = summarize(index, month_start, month_end)
 
-    total_consumption_str = f"{total_consumption:.2f}".replace(".", ",")
-    total_production_str = f"{total_production:.2f}".replace(".", ",")
-    avg_temp_str = f"{avg_temp:.2f}".replace(".", ",")
+    month_name = month_start.strftime("%B")
+
+    total_consumption_str = format_decimal_fi(total_consumption)
+    total_production_str = format_decimal_fi(total_production)
+    avg_temp_str = format_decimal_fi(avg_temp)
 
     lines = [
         "-----------------------------------------------------",
@@ -85,48 +685,242 @@ def create_monthly_report(data: List[Dict]) -> List[str]:
     ]
     return lines
 
-def create_yearly_report(data: List[Dict]) -> List[str]:
-    """Builds a full-year summary report."""
-    total_consumption = sum(row["consumption"] for row in data)
-    total_production = sum(row["production"] for row in data)
-    avg_temp = sum(row["temperature"] for row in data) / len(data) if data else 0
+def create_yearly_report(index, cache: ReportCache = None) -> List[str]:
+    """Builds a full-year summary report (for a selected year, if there are several)."""
+    year = ask_year(index)
+    if cache is None:
+        return yearly_report(index, year)
+    return cache.get("yearly", (year,), lambda: yearly_report(index, year))
+
+@PROFILER.measure("yearly_report", rows=lambda lines, *args: len(lines))
+def yearly_report(index, year: int = None) -> List[str]:
+    """Builds the summary report lines of one year, or of all the data."""
+    years = data_years(index) if year is None else [year]
+    if year is None and isinstance(index, dict):
+        total_consumption, total_production, avg_temp = summarize(index, date.min, date.max)
+    elif years:
+        total_consumption, total_production, avg_temp = summarize(
+            index, date(years[0], 1, 1), date(years[-1], 12, 31))
+    else:
+        total_consumption = total_production = avg_temp = 0
 
-    total_consumption_str = f"{total_consumption:.2f}".replace(".", ",")
-    total_production_str = f"{total_production:.2f}".replace(".", ",")
-    avg_temp_str = f"{avg_temp:.2f}".replace(".", ",")
+    total_consumption_str = format_decimal_fi(total_consumption)
+    total_production_str = format_decimal_fi(total_production)
+    avg_temp_str = format_decimal_fi(avg_temp)
 
     lines = [
         
-        f"Report for the year: 2025",
+        f"Report for the year: {years_label(years)}",
         f"- Total consumption: {total_consumption_str} kWh",
         f"- Total production: {total_production_str} kWh",
         f"- Average temperature: {avg_temp_str} °C"
     ]
     return lines
 
+@PROFILER.measure("print_report_to_console", rows=lambda result, lines: len(lines))
 def print_report_to_console(lines: List[str]) -> None:
     """Prints the report lines to the console."""
-    for line in lines:
-        print(line)
+    with ReportWriter() as writer:
+        for line in lines:
+            writer.write_line(line)
 
+@PROFILER.measure("write_report_to_file", rows=lambda result, lines: len(lines))
 def write_report_to_file(lines: List[str]) -> None:
     """Writes the report lines to report.txt."""
-    with open("report.txt", "w", encoding="utf-8") as f:
+    with open("report.txt", "w", encoding="utf-8") as f, ReportWriter(f) as writer:
         for line in lines:
-            f.write(line + "\n")
+            writer.write_line(line)
     print("Report written to report.txt")
 
+# SERVER MODE #
+
+def build_report(index: Dict, path: str, params: Dict[str, str]) -> List[str]:
+    """
+    Builds the report for a server request:
+    /daily?start=dd.mm.yyyy&end=dd.mm.yyyy, /monthly?month=1-12[&year=yyyy] or
+    /yearly[?year=yyyy].
+    """
+    year = int(params["year"]) if "year" in params else None
+    if path == "/daily":
+        return daily_report(index, params["start"], params["end"])
+    if path == "/monthly":
+        return monthly_report(index, int(params["month"]), year)
+    return yearly_report(index, year)
+
+REPORT_PATHS = ("/daily", "/monthly", "/yearly")
+
+class ReportServer(HTTPServer):
+    """HTTP server that loads and indexes the data once and caches report results."""
+
+    def __init__(self, address: Tuple[str, int], filename: str, cache_size: int = 128):
+        super().__init__(address, ReportHandler)
+        self.filename = filename
+        self.data, self.source = load_data(filename)
+        self.index = build_day_index(self.data)
+        self.stat = os.stat(filename)
+        self.cache = ReportCache(cache_size)
+
+    def report(self, path: str, params: Dict[str, str]) -> List[str]:
+        """Returns the report lines, from the cache unless the data file has changed."""
+        stat = os.stat(self.filename)
+        if (stat.st_size, stat.st_mtime_ns) != (self.stat.st_size, self.stat.st_mtime_ns):
+            self.data, self.index, self.source = refresh_data(self.filename, self.data, self.index, self.source)
+            self.stat = stat
+            self.cache.invalidate()
+        return self.cache.get(path, tuple(sorted(params.items())),
+                              lambda: build_report(self.index, path, params))
+
+class ReportHandler(BaseHTTPRequestHandler):
+    """
+    Answers GET requests with a report as JSON ({"report": [lines]}) or text
+    (format=text). /stats returns the report cache counters.
+    """
+
+    def do_GET(self) -> None:
+        url = urlparse(self.path)
+        params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        text = params.pop("format", "json") == "text"
+        if url.path == "/stats":
+            self.send_body(200, {"cache": self.server.cache.stats()}, False)
+            return
+        if url.path not in REPORT_PATHS:
+            self.send_body(404, {"error": f"Unknown report {url.path}"}, text)
+            return
+        try:
+            lines = self.server.report(url.path, params)
+        except KeyError as error:
+            self.send_body(400, {"error": f"Missing parameter {error}"}, text)
+        except ValueError as error:
+            self.send_body(400, {"error": str(error)}, text)
+        else:
+            self.send_body(200, {"report": lines}, text)
+
+    def send_body(self, status: int, result: Dict, text: bool) -> None:
+        """Sends the result as JSON, or as plain text lines."""
+        if text:
+            body = "\n".join(result.get("report") or [result.get("error", "")]) + "\n"
+            content_type = "text/plain; charset=utf-8"
+        else:
+            body = json.dumps(result, ensure_ascii=False)
+            content_type = "application/json; charset=utf-8"
+        data = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format: str, *args) -> None:
+        pass  # keep the console quiet
+
+def serve(filename: str, port: int, cache_size: int = 128) -> None:
+    """Runs the report server on localhost until interrupted."""
+    server = ReportServer(("127.0.0.1", port), filename, cache_size)
+    print(f"Serving reports on http://127.0.0.1:{port}/ (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+def load_test(url: str, count: int) -> None:
+    """Sends count GET requests to url one after another and prints p50/p99 latency."""
+    latencies = []
+    for _ in range(count):
+        start = time.perf_counter()
+        with urlopen(url) as response:
+            response.read()
+        latencies.append(time.perf_counter() - start)
+    latencies.sort()
+    p50 = latencies[len(latencies) // 2] * 1000
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000
+    print(f"{count} requests to {url}: p50 {p50:.3f} ms, p99 {p99:.3f} ms")
+
+def parse_args() -> argparse.Namespace:
+    """Parses the command line options."""
+    parser = argparse.ArgumentParser(description="Electricity and temperature reports")
+    parser.add_argument("--file", nargs="+", default=["2025.csv"],
+                        help="CSV data files, read concurrently and reported together (default 2025.csv)")
+    parser.add_argument("--data-dir", metavar="DIR",
+                        help="read DIR/<site>/<year>.csv files as partitions instead of --file")
+    parser.add_argument("--site", help="site directory to report on (default: the first one)")
+    parser.add_argument("--memory-budget", type=int, default=64,
+                        help="MiB of partitions to keep loaded (default 64)")
+    parser.add_argument("--serve", action="store_true",
+                        help="run a report server on localhost instead of the menus")
+    parser.add_argument("--port", type=int, default=8025, help="server port (default 8025)")
+    parser.add_argument("--cache-size", type=int, default=128,
+                        help="number of report results to keep (default 128)")
+    parser.add_argument("--load-test", metavar="URL",
+                        help="send requests to a running server and print p50/p99 latency")
+    parser.add_argument("--requests", type=int, default=1000,
+                        help="number of load-test requests (default 1000)")
+    parser.add_argument("--profile", metavar="JSON",
+                        help=f"write a timing report (same as {PROFILE_ENV}=JSON)")
+    parser.add_argument("--cprofile", metavar="STATS",
+                        help=f"also save cProfile stats (same as {CPROFILE_ENV}=STATS)")
+    args = parser.parse_args()
+    if args.serve and len(args.file) > 1:
+        parser.error("--serve reads one --file")
+    return args
+
 def main() -> None:
     """Main function: reads data, shows menus, and controls report generation."""
-    data = read_data("2025.csv")
+    args = parse_args()
+    if args.profile or args.cprofile:
+        PROFILER.start(args.profile, args.cprofile)
+    filenames = args.file
+    if args.load_test:
+        load_test(args.load_test, args.requests)
+        return
+    if args.serve:
+        serve(filenames[0], args.port, args.cache_size)
+        return
+
+    cache = ReportCache(args.cache_size)
+    if args.data_dir:
+        store = PartitionStore(args.data_dir, args.memory_budget << 20)
+        sites = store.sites()
+        site = args.site or (sites[0] if sites else "")
+        if site not in sites:
+            print(f"No site {site!r} in {args.data_dir}")
+            return
+        index = store.site(site)
+        stat = index.stat()
+    elif len(filenames) == 1:
+        data, source = load_data(filenames[0])
+        index = build_day_index(data)
+        stat = os.stat(filenames[0])
+    else:
+        index = build_day_index(read_many(filenames))
+        stat = [os.stat(filename) for filename in filenames]
     while True:
-        choice = show_main_menu()
+        choice = show_main_menu(data_years(index))
+        if args.data_dir:
+            new_stat = index.stat()
+            if new_stat != stat:
+                cache.invalidate()  # the partitions reload themselves
+                stat = new_stat
+        elif len(filenames) == 1:
+            new_stat = os.stat(filenames[0])
+            if (new_stat.st_size, new_stat.st_mtime_ns) != (stat.st_size, stat.st_mtime_ns):
+                data, index, source = refresh_data(filenames[0], data, index, source)
+                cache.invalidate()
+                stat = new_stat
+        else:
+            new_stat = [os.stat(filename) for filename in filenames]
+            if ([(st.st_size, st.st_mtime_ns) for st in new_stat]
+                    != [(st.st_size, st.st_mtime_ns) for st in stat]):
+                index = build_day_index(read_many(filenames))  # unchanged files come from their caches
+                cache.invalidate()
+                stat = new_stat
         if choice == "1":
-            report = create_daily_report(data)
+            report = create_daily_report(index, cache)
         elif choice == "2":
-            report = create_monthly_report(data)
+            report = create_monthly_report(index, cache)
         elif choice == "3":
-            report = create_yearly_report(data)
+            report = create_yearly_report(index, cache)
         elif choice == "4":
             print("Exiting program.")
             break
@@ -1,4 +1,15 @@
+import argparse
+import os
+import sys
 from datetime import datetime
+from itertools import chain
+
+# The helpers shared by the tasks are in task_common.py at the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from task_common import (
+    ReportWriter, format_date_fi, format_decimal_fi, format_time_fi, load_many, parse_date,
+    parse_time, profiler_from_env
+)
 
 HEADERS = [
     "reservationId",
@@ -14,6 +25,8 @@ HEADERS = [
     "createdAt",
 ]
 
+PROFILER = profiler_from_env()
+
 def convert_reservation_data(reservation: list) -> list:
     """
     Convert reservation data types
@@ -22,13 +35,13 @@ def convert_reservation_data(reservation: list) -> list:
     name = reservation[1]
     email = reservation[2]
     phone = reservation[3]
-    reservation_date = datetime.strptime(reservation[4], "%Y-%m-%d").date()
-    reservation_time = datetime.strptime(reservation[5], "%H:%M").time()
+    reservation_date = parse_date(reservation[4])
+    reservation_time = parse_time(reservation[5])
     duration_hours = int(reservation[6])
     price = float(reservation[7])
     confirmed = reservation[8] == "True"
     reserved_resource = reservation[9]
-    created_at = datetime.strptime(reservation[10], "%Y-%m-%d %H:%M:%S")
+    created_at = datetime.fromisoformat(reservation[10])
 
     return [
         reservation_id, name, email, phone,
@@ -38,6 +51,7 @@ def convert_reservation_data(reservation: list) -> list:
         created_at
     ]
 
+@PROFILER.measure("fetch_reservations", rows=lambda reservations, *args: len(reservations))
 def fetch_reservations(reservation_file: str) -> list:
     reservations = []
     with open(reservation_file, "r", encoding="utf-8") as f:
@@ -46,63 +60,159 @@ def fetch_reservations(reservation_file: str) -> list:
             reservations.append(convert_reservation_data(fields))
     return reservations
 
+# PART A AND B REPORTS #
+# Each report gets start(out), add(r, out) for every reservation and
+# finish(out), where out prints one line. Reports with per_row = True write
+# lines from add(); the others only count in add() and write in finish(),
+# so run_reports can feed them from the pass of an earlier report.
+
+class ReservationTable:
+    """Part A: every reservation with its values and their data types."""
+
+    per_row = True
+
+    def start(self, out) -> None:
+        out(" | ".join(HEADERS))
+        out("-" * 120)
+
+    def add(self, r: list, out) -> None:
+        out(" | ".join(str(x) for x in r))
+        out(" | ".join(type(x).__name__ for x in r))
+        out("-" * 120)
+
+    def finish(self, out) -> None:
+        pass
+
+class ConfirmedReport:
+    per_row = True
+
+    def start(self, out) -> None:
+        out("1) Confirmed Reservations")
+
+    def add(self, r: list, out) -> None:
+        if r[8]:  # confirmed == True
+            out(f"- {r[1]}, {r[9]}, {format_date_fi(r[4])} at {format_time_fi(r[5])}")
+
+    def finish(self, out) -> None:
+        out("")
+
+class LongReport:
+    per_row = True
+
+    def start(self, out) -> None:
+        out("2) Long Reservations (≥ 3 h)")
+
+    def add(self, r: list, out) -> None:
+        if r[6] >= 3:  # durationHours >= 3
+            out(f"- {r[1]}, {format_date_fi(r[4])} at {format_time_fi(r[5])}, duration {r[6]} h, {r[9]}")
+
+    def finish(self, out) -> None:
+        out("")
+
+class StatusReport:
+    per_row = True
+
+    def start(self, out) -> None:
+        out("3) Reservation Confirmation Status")
+
+    def add(self, r: list, out) -> None:
+        status = "Confirmed" if r[8] else "NOT Confirmed"
+        out(f"{r[1]} → {status}")
+
+    def finish(self, out) -> None:
+        out("")
+
+class SummaryReport:
+    def start(self, out) -> None:
+        self.confirmed_count = 0
+        self.count = 0
+
+    def add(self, r: list, out) -> None:
+        self.confirmed_count += r[8]
+        self.count += 1
+
+    def finish(self, out) -> None:
+        out("4) Confirmation Summary")
+        out(f"- Confirmed reservations: {self.confirmed_count} pcs")
+        out(f"- Not confirmed reservations: {self.count - self.confirmed_count} pcs")
+        out("")
+
+class RevenueReport:
+    def start(self, out) -> None:
+        self.revenue = 0
+
+    def add(self, r: list, out) -> None:
+        if r[8]:
+            self.revenue += r[7] * r[6]  # price * durationHours for confirmed
+
+    def finish(self, out) -> None:
+        amount_str = format_decimal_fi(self.revenue)
+        out("5) Total Revenue from Confirmed Reservations")
+        out(f"Total revenue from confirmed reservations: {amount_str} €")
+        out("")
+
+@PROFILER.measure("run_reports", rows=lambda result, reservations, *args: len(reservations))
+def run_reports(reservations: list[list], reports: list, out=print) -> None:
+    """
+    Runs the reports with as few passes over the reservations as the output
+    order allows, without buffering any lines. A per-row report gets a pass of
+    its own, and the reports after it that only write totals in finish() share
+    that pass. Reports before the first per-row report share one pass too.
+    """
+    passes = []
+    for report in reports:
+        if not passes or getattr(report, "per_row", False):
+            passes.append([])
+        passes[-1].append(report)
+    for group in passes:
+        for report in group:
+            report.start(out)
+        for r in reservations:
+            for report in group:
+                report.add(r, out)
+        for report in group:
+            report.finish(out)
+
 # PART B FUNCTIONS #
 
 def confirmed_reservations(reservations: list[list]) -> None:
-    print("1) Confirmed Reservations")
-    for r in reservations:
-        if r[8]:  # confirmed == True
-            print(f"- {r[1]}, {r[9]}, {r[4].strftime('%d.%m.%Y')} at {r[5].strftime('%H.%M')}")
-    print()
+    run_reports(reservations, [ConfirmedReport()])
 
 def long_reservations(reservations: list[list]) -> None:
-    print("2) Long Reservations (≥ 3 h)")
-    for r in reservations:
-        if r[6] >= 3:  # durationHours >= 3
-            print(f"- {r[1]}, {r[4].strftime('%d.%m.%Y')} at {r[5].strftime('%H.%M')}, duration {r[6]} h, {r[9]}")
-    print()
+    run_reports(reservations, [LongReport()])
 
 def confirmation_statuses(reservations: list[list]) -> None:
-    print("3) Reservation Confirmation Status")
-    for r in reservations:
-        status = "Confirmed" if r[8] else "NOT Confirmed"
-        print(f"{r[1]} → {status}")
-    print()
+    run_reports(reservations, [StatusReport()])
 
 def confirmation_summary(reservations: list[list]) -> None:
-    confirmed_count = sum(r[8] for r in reservations)
-    not_confirmed_count = len(reservations) - confirmed_count
-    print("4) Confirmation Summary")
-    print(f"- Confirmed reservations: {confirmed_count} pcs")
-    print(f"- Not confirmed reservations: {not_confirmed_count} pcs")
-    print()
+    run_reports(reservations, [SummaryReport()])
 
 def total_revenue(reservations: list[list]) -> None:
-    revenue = sum(r[7] * r[6] for r in reservations if r[8])  # price * durationHours for confirmed
-    amount_str = f"{revenue:.2f}".replace(".", ",")
-    print("5) Total Revenue from Confirmed Reservations")
-    print(f"Total revenue from confirmed reservations: {amount_str} €")
-    print()
+    run_reports(reservations, [RevenueReport()])
 
 #  MAIN  #
 
+def parse_args() -> argparse.Namespace:
+    """Parses the command line options."""
+    parser = argparse.ArgumentParser(description="Reservation reports")
+    parser.add_argument("files", nargs="*", default=["reservations.txt"],
+                        help="reservation files, read concurrently (default reservations.txt)")
+    return parser.parse_args()
+
 def main():
-    reservations = fetch_reservations("reservations.txt")
-
-    # PART A: Print all reservations and data types
-    print(" | ".join(HEADERS))
-    print("-" * 120)
-    for reservation in reservations:
-        print(" | ".join(str(x) for x in reservation))
-        print(" | ".join(type(x).__name__ for x in reservation))
-        print("-" * 120)
-
-    # PART B: Print summaries
-    confirmed_reservations(reservations)
-    long_reservations(reservations)
-    confirmation_statuses(reservations)
-    confirmation_summary(reservations)
-    total_revenue(reservations)
+    args = parse_args()
+    reservations = list(chain.from_iterable(load_many(fetch_reservations, args.files)))
+
+    # PART A and PART B: the totals share the last listing's pass
+    with ReportWriter() as writer:
+        run_reports(reservations, [
+            ReservationTable(),
+            ConfirmedReport(),
+            LongReport(),
+            StatusReport(),
+            SummaryReport(),
+            RevenueReport(),
+        ], out=writer.write_line)
 
 if __name__ == "__main__":
     main()
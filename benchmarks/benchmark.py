@@ -0,0 +1,292 @@
+# Copyright (c) 2026 Jony Ahammad
+# License: MIT
+
+"""
+Times the load -> aggregate -> render pipeline of each task on generated
+input files and writes the results as JSON, so runs can be compared.
+
+Usage:
+    python benchmark.py [--tasks task_c task_f ...] [--sizes 1e3 1e5 1e7]
+                        [--seed N] [--output results.json] [--compare old.json]
+
+Every run is done in its own process, so the peak memory (max RSS) and the
+module caches belong to that run only. Generated files are kept in
+benchmarks/data/ and reused by later runs with the same size and seed.
+"""
+
+import argparse
+import contextlib
+import importlib.util
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+from datetime import datetime, timedelta
+from time import perf_counter
+from typing import Dict, List
+
+from generate import generate
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
+class StageTimer:
+    """Collects the wall time of named stages."""
+
+    def __init__(self):
+        self.stages = {}
+
+    @contextlib.contextmanager
+    def __call__(self, name: str):
+        started = perf_counter()
+        try:
+            yield
+        finally:
+            self.stages[name] = round(perf_counter() - started, 6)
+
+def load_module(path: str):
+    """Imports a task script from its file (the folder names are not packages)."""
+    name = os.path.splitext(os.path.basename(path))[0]
+    spec = importlib.util.spec_from_file_location(name, os.path.join(ROOT, path))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def run_task_b(module, filename: str, timer: StageTimer) -> None:
+    with timer("load"):
+        with open(filename, "r", encoding="utf-8") as f:
+            reservations = [line.strip().split("|") for line in f]
+    with timer("render"):
+        for reservation in reservations:
+            module.print_reservation_number(reservation)
+            module.print_booker(reservation)
+            module.print_date(reservation)
+            module.print_start_time(reservation)
+            module.print_hours(reservation)
+            module.print_hourly_rate(reservation)
+            module.print_total_price(reservation)
+            module.print_paid(reservation)
+            module.print_venue(reservation)
+            module.print_phone(reservation)
+            module.print_email(reservation)
+
+def run_slips(module, filename: str, timer: StageTimer) -> None:
+    with timer("load"):
+        reservations = list(module.read_reservations(filename))
+    with timer("render"):
+        module.print_slips(reservations, module.SLIP_TEMPLATE)
+
+def run_task_c(module, filename: str, timer: StageTimer) -> None:
+    with timer("load"):
+        reservations = module.fetch_reservations(filename)
+    with timer("aggregate+render"):  # the reports aggregate while they write
+        with module.ReportWriter() as writer:
+            module.run_reports(reservations, [
+                module.ReservationTable(),
+                module.ConfirmedReport(),
+                module.LongReport(),
+                module.StatusReport(),
+                module.SummaryReport(),
+                module.RevenueReport(),
+            ], out=writer.write_line)
+
+def run_task_c_passes(module, filename: str, timer: StageTimer) -> None:
+    """The same reports with one pass over the reservations each, as before the shared scan."""
+    with timer("load"):
+        reservations = module.fetch_reservations(filename)
+    with timer("aggregate+render"):
+        with module.ReportWriter() as writer:
+            for report in (module.ReservationTable(), module.ConfirmedReport(), module.LongReport(),
+                           module.StatusReport(), module.SummaryReport(), module.RevenueReport()):
+                module.run_reports(reservations, [report], out=writer.write_line)
+
+def run_task_d(module, filename: str, timer: StageTimer) -> None:
+    with timer("load"):
+        columns = module.read_columns(filename, use_cache=False)
+    with timer("aggregate"):
+        daily_totals = module.calculate_daily_totals_from_columns(columns)
+    with timer("render"):
+        module.print_report(daily_totals)
+
+def run_task_e(module, filename: str, timer: StageTimer) -> None:
+    with timer("load+aggregate"):  # the rows are streamed into the summary
+        summary = module.summarize_file(filename)
+    with timer("render"):
+        module.write_report({"1": summary})
+
+def run_task_f(module, filename: str, timer: StageTimer) -> None:
+    with timer("load"):
+        data = module.read_data(filename, use_cache=False)
+    with timer("aggregate"):
+        index = module.build_day_index(data)
+    with timer("render"):
+        first = module.hour_to_date(data["hour"][0])
+        days = module.hour_to_date(data["hour"][-1]).toordinal() - first.toordinal() + 1
+        reports = [module.yearly_report(index)]
+        reports += [module.monthly_report(index, month) for month in range(1, 13)]
+        for day in range(days):  # one daily report per day
+            text = (first + timedelta(days=day)).strftime("%d.%m.%Y")
+            reports.append(module.daily_report(index, text, text))
+        for lines in reports:
+            module.print_report_to_console(lines)
+
+def run_task_g_class(module, filename: str, timer: StageTimer) -> None:
+    with timer("load"):
+        reservations = module.fetch_reservations(filename)
+    with timer("aggregate"):
+        store = module.ReservationStore(reservations)
+    with timer("render"):
+        module.print_confirmed(store.confirmed())
+        module.print_long_reservations(list(store))
+        module.calculate_total_revenue(list(store))
+
+def run_task_g_conflicts(module, filename: str, timer: StageTimer) -> None:
+    with timer("load"):
+        reservations = module.fetch_reservations(filename)
+    with timer("aggregate"):
+        store = module.ReservationStore(reservations)
+    with timer("conflicts"):
+        sum(1 for _ in store.conflicts())
+    with timer("is_free"):  # 10000 one-hour windows spread over the bookings
+        resources = sorted({reservation.resource for reservation in reservations})
+        for i in range(10000):
+            start = reservations[i * 7919 % len(reservations)].start()
+            store.is_free(resources[i % len(resources)], start, start + timedelta(hours=1))
+
+def run_task_g_rollups(module, filename: str, timer: StageTimer) -> None:
+    with timer("load"):
+        reservations = module.fetch_reservations(filename)
+    with timer("aggregate"):
+        store = module.ReservationStore(reservations)
+    with timer("rollups"):  # every resource and status by day, week and month
+        cube = store.cube()
+        for resource in cube.resources():
+            for confirmed in (None, True, False):
+                for period in ("day", "week", "month"):
+                    cube.rollup(period, "revenue", resource, confirmed)
+                    cube.rollup(period, "hours", resource, confirmed)
+
+def run_task_g_dict(module, filename: str, timer: StageTimer) -> None:
+    with timer("load"):
+        reservations = module.fetch_reservations(filename)
+    with timer("render"):
+        module.print_confirmed(reservations)
+        module.print_long_reservations(reservations)
+        module.calculate_total_revenue(reservations)
+
+# Task name: (script, input format, pipeline)
+TASKS = {
+    "task_a_batch": ("task A/taska.py", "reservations10", run_slips),
+    "task_b": ("taskb/task_b.py", "reservations10", run_task_b),
+    "task_b_batch": ("taskb/task_b.py", "reservations10", run_slips),
+    "task_c": ("Task_C/task_c.py", "reservations11", run_task_c),
+    "task_c_passes": ("Task_C/task_c.py", "reservations11", run_task_c_passes),
+    "task_d": ("task_D/task_d.py", "week-en", run_task_d),
+    "task_e": ("task_E/task_e.py", "week-fi", run_task_e),
+    "task_f": ("Task f/task_f.py", "year", run_task_f),
+    "task_g_class": ("task_g/task_g_class.py", "reservations11-header", run_task_g_class),
+    "task_g_conflicts": ("task_g/task_g_class.py", "reservations11-header", run_task_g_conflicts),
+    "task_g_rollups": ("task_g/task_g_class.py", "reservations11-header", run_task_g_rollups),
+    "task_g_dict": ("task_g/task_g_dict.py", "reservations11-header", run_task_g_dict),
+}
+
+def run_child(task: str, rows: int, filename: str) -> Dict:
+    """Runs one pipeline in this process with output discarded and returns its timings."""
+    script, _, pipeline = TASKS[task]
+    module = load_module(script)
+    timer = StageTimer()
+    with tempfile.TemporaryDirectory() as work_dir, open(os.devnull, "w") as devnull:
+        os.chdir(work_dir)  # reports written to files end up here
+        with contextlib.redirect_stdout(devnull):
+            pipeline(module, filename, timer)
+        os.chdir(ROOT)
+    seconds = sum(timer.stages.values())
+    return {
+        "task": task,
+        "rows": rows,
+        "stages": timer.stages,
+        "seconds": round(seconds, 6),
+        "rows_per_second": round(rows / seconds) if seconds > 0 else None,
+        "max_rss_kib": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss if resource else None,
+    }
+
+def input_file(file_format: str, rows: int, seed: int) -> str:
+    """Returns the generated input file, writing it first if it does not exist yet."""
+    filename = os.path.join(DATA_DIR, f"{file_format}-{rows}-{seed}.txt")
+    if not os.path.exists(filename):
+        os.makedirs(DATA_DIR, exist_ok=True)
+        print(f"generating {os.path.basename(filename)}", file=sys.stderr)
+        generate(file_format, rows, filename + ".tmp", seed)
+        os.replace(filename + ".tmp", filename)
+    return filename
+
+def run_benchmarks(tasks: List[str], sizes: List[int], seed: int) -> Dict:
+    """Runs every task at every size, each in a fresh process."""
+    results = []
+    for task in tasks:
+        for rows in sizes:
+            filename = input_file(TASKS[task][1], rows, seed)
+            print(f"{task} {rows} rows", file=sys.stderr)
+            child = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), "--child", task, str(rows), filename],
+                capture_output=True, text=True)
+            if child.returncode != 0:
+                sys.exit(f"{task} failed at {rows} rows:\n{child.stderr}")
+            results.append(json.loads(child.stdout))
+    return {
+        "started": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": seed,
+        "results": results,
+    }
+
+def compare(old: Dict, new: Dict) -> None:
+    """Prints the time of each run against an earlier result file."""
+    previous = {(r["task"], r["rows"]): r for r in old["results"]}
+    print(f"{'task':<14} {'rows':>10} {'old s':>10} {'new s':>10} {'ratio':>7}", file=sys.stderr)
+    for r in new["results"]:
+        before = previous.get((r["task"], r["rows"]))
+        if before and before["seconds"]:
+            print(f"{r['task']:<14} {r['rows']:>10} {before['seconds']:>10.3f} {r['seconds']:>10.3f} "
+                  f"{r['seconds'] / before['seconds']:>7.2f}", file=sys.stderr)
+
+def parse_args() -> argparse.Namespace:
+    """Parses the command line options."""
+    parser = argparse.ArgumentParser(description="Benchmark the task pipelines")
+    parser.add_argument("--tasks", nargs="+", choices=sorted(TASKS), default=sorted(TASKS))
+    parser.add_argument("--sizes", nargs="+", type=lambda text: int(float(text)),
+                        default=[1000, 10000, 100000], help="row counts (default 1e3 1e4 1e5)")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", help="JSON result file (default stdout)")
+    parser.add_argument("--compare", metavar="JSON", help="earlier result file to compare with")
+    parser.add_argument("--child", nargs=3, metavar=("TASK", "ROWS", "FILE"), help=argparse.SUPPRESS)
+    return parser.parse_args()
+
+def main() -> None:
+    args = parse_args()
+    if args.child:
+        task, rows, filename = args.child
+        print(json.dumps(run_child(task, int(rows), filename)))
+        return
+
+    report = run_benchmarks(args.tasks, args.sizes, args.seed)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            compare(json.load(f), report)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,258 @@
+# Copyright (c) 2026 Jony Ahammad
+# License: MIT
+
+"""
+Checks that the fast paths of the tasks give the same results as their plain
+row-by-row versions on generated input, including input in a shuffled order.
+
+Usage: python check.py [--checks NAME ...] [--rows N] [--seed N]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+from copy import copy
+from datetime import date, datetime, time, timedelta
+from typing import Callable, Dict, List
+
+from benchmark import load_module
+from compare import old_task_f_read_data
+from generate import YEAR_HEADER, generate, year_rows
+
+def shuffled_copy(filename: str, seed: int) -> str:
+    """Writes the lines of a file after its header in random order and returns the new file."""
+    with open(filename, "r", encoding="utf-8") as f:
+        header, *lines = f.read().split("\n")
+    random.Random(seed).shuffle(lines)
+    shuffled = filename + ".shuffled"
+    with open(shuffled, "w", encoding="utf-8") as f:
+        f.write("\n".join([header] + lines))
+    return shuffled
+
+def check_task_d(work_dir: str, rows: int, seed: int) -> None:
+    """calculate_daily_totals_from_columns against the row loop, in file and shuffled order."""
+    module = load_module("task_D/task_d.py")
+    filename = os.path.join(work_dir, "week-en.csv")
+    generate("week-en", rows, filename, seed)
+    for name in (filename, shuffled_copy(filename, seed)):
+        columns = module.read_columns(name, use_cache=False)
+        expected = module.calculate_daily_totals(module.read_data(name))
+        if module.calculate_daily_totals_from_columns(columns) != expected:
+            raise AssertionError(f"daily totals differ for {os.path.basename(name)}")
+
+def row_loop_summary(rows: List[Dict], start: date, end: date) -> List[str]:
+    """The report values of Task f's row-by-row reports: filter the rows, then sum the floats."""
+    filtered = [row for row in rows if start <= row["date"] <= end]
+    temperature = sum(row["temperature"] for row in filtered) / len(filtered) if filtered else 0
+    return ["%.2f" % value for value in (sum(row["consumption"] for row in filtered),
+                                         sum(row["production"] for row in filtered), temperature)]
+
+def report_ranges(first: date, days: int, count: int, seed: int) -> List[tuple]:
+    """Every month, the whole data and count random day ranges (inclusive) from first on."""
+    rng = random.Random(seed)
+    last = first + timedelta(days=days - 1)
+    ranges = [(date.min, date.max)]
+    for year in range(first.year, last.year + 1):
+        for month in range(1, 13):
+            start = date(year, month, 1)
+            ranges.append((start, (start + timedelta(days=31)).replace(day=1) - timedelta(days=1)))
+    for _ in range(count):
+        start = rng.randrange(-2, days + 2)
+        end = rng.randrange(start, days + 3)
+        ranges.append((first + timedelta(days=start), first + timedelta(days=end)))
+    return ranges
+
+def check_task_f(work_dir: str, rows: int, seed: int) -> None:
+    """The day index report values against the row loop, in file and shuffled order."""
+    module = load_module("Task f/task_f.py")
+    filename = os.path.join(work_dir, "year.csv")
+    generate("year", rows, filename, seed)
+    ranges = report_ranges(date(2025, 1, 1), rows // 24 + 1, 2000, seed)
+    for name in (filename, shuffled_copy(filename, seed)):
+        expected = old_task_f_read_data(name)
+        index = module.build_day_index(module.read_data(name, use_cache=False))
+        for start, end in ranges:
+            values = ["%.2f" % value for value in module.summarize(index, start, end)]
+            if values != row_loop_summary(expected, start, end):
+                raise AssertionError(f"{start}–{end} of {os.path.basename(name)}: {values} "
+                                     f"!= {row_loop_summary(expected, start, end)}")
+
+def check_task_f_partitions(work_dir: str, rows: int, seed: int) -> None:
+    """Reports from site/year partitions against one day index of the same files."""
+    module = load_module("Task f/task_f.py")
+    hours = max(rows, 400 * 24)  # at least two years
+    for site in range(2):
+        files = {}
+        for line in year_rows(hours, seed + site):
+            files.setdefault(line[:4], []).append(line)
+        os.makedirs(os.path.join(work_dir, f"site{site}"))
+        for year, lines in files.items():
+            with open(os.path.join(work_dir, f"site{site}", f"{year}.csv"), "w", encoding="utf-8") as f:
+                f.write("\n".join([YEAR_HEADER] + lines))
+
+    store = module.PartitionStore(work_dir, memory_budget=1 << 16)  # evicts partitions
+    for site in store.sites():
+        partitioned = store.site(site)
+        years = partitioned.years()
+        index = module.build_day_index(module.read_many([store.filename(site, year) for year in years]))
+        reports = [("yearly", (year,)) for year in years + [None]]
+        reports += [("monthly", (month, year)) for year in years for month in range(1, 13)]
+        reports += [("daily", (start.strftime("%d.%m.%Y"), end.strftime("%d.%m.%Y")))
+                    for start, end in report_ranges(date(2025, 1, 1), hours // 24 + 1, 300, seed)[13:]]
+        for report, params in reports:
+            build = getattr(module, report + "_report")
+            if build(partitioned, *params) != build(index, *params):
+                raise AssertionError(f"{site} {report} {params}: {build(partitioned, *params)} "
+                                     f"!= {build(index, *params)}")
+
+def generated_reservations(module, work_dir: str, rows: int, seed: int) -> list:
+    """Writes a generated task_g reservations file and returns its Reservation objects."""
+    filename = os.path.join(work_dir, "reservations.txt")
+    generate("reservations11-header", rows, filename, seed)
+    return module.fetch_reservations(filename)
+
+def overlapping_pairs(reservations: list) -> set:
+    """Every pair of reservations of the same resource that overlap in time, compared pairwise."""
+    pairs = set()
+    for i, first in enumerate(reservations):
+        for second in reservations[i + 1:]:
+            if (first.resource == second.resource and first.start() < second.end()
+                    and second.start() < first.end()):
+                pairs.add(frozenset((first.reservation_id, second.reservation_id)))
+    return pairs
+
+def check_task_g_schedule(work_dir: str, rows: int, seed: int) -> None:
+    """The store's treap conflicts and is_free against pairwise comparison, after moves and removals."""
+    module = load_module("task_g/task_g_class.py")
+    rng = random.Random(seed)
+    reservations = generated_reservations(module, work_dir, min(rows, 2000), seed)
+    store = module.ReservationStore(reservations)
+    resources = sorted({reservation.resource for reservation in reservations}) + ["Unknown Room"]
+    next_id = max(reservation.reservation_id for reservation in reservations) + 1
+    for step in range(5):
+        live = list(store)
+        found = [frozenset((first.reservation_id, second.reservation_id)) for first, second in store.conflicts()]
+        expected = overlapping_pairs(live)
+        if len(found) != len(expected) or set(found) != expected:
+            raise AssertionError(f"step {step}: {len(found)} conflicts != {len(expected)} overlapping pairs")
+        for _ in range(500):
+            resource = rng.choice(resources)
+            start = datetime(2025, 1, 1) + timedelta(minutes=30 * rng.randrange(-48, 366 * 48))
+            end = start + timedelta(minutes=30 * rng.randint(1, 12))
+            expected = not any(reservation.resource == resource and reservation.start() < end
+                               and start < reservation.end() for reservation in live)
+            if store.is_free(resource, start, end) != expected:
+                raise AssertionError(f"step {step}: is_free({resource!r}, {start}, {end}) != {expected}")
+        for reservation in rng.sample(live, len(live) // 10):
+            change = rng.randrange(3)
+            if change == 0:
+                store.remove(reservation.reservation_id)
+            elif change == 1:
+                store.update(reservation.reservation_id, time=time(rng.randrange(24), rng.choice((0, 30))),
+                             duration=rng.randint(1, 6))
+            else:
+                store.update(reservation.reservation_id, resource=rng.choice(resources))
+        for _ in range(len(live) // 20):
+            added = copy(rng.choice(list(store)))
+            added.reservation_id = next_id
+            next_id += 1
+            store.add(added)
+
+def scanned_totals(reservations: list, period, resource: str = None, confirmed: bool = None) -> Dict:
+    """Revenue (cents) and booked hours per period(day) of the matching reservations, record by record."""
+    totals = {}
+    for reservation in reservations:
+        if resource is not None and reservation.resource != resource:
+            continue
+        if confirmed is not None and bool(reservation.confirmed) != confirmed:
+            continue
+        key = period(reservation.date)
+        revenue, hours = totals.get(key, (0, 0))
+        totals[key] = (revenue + round(reservation.price * 100) * reservation.duration,
+                       hours + reservation.duration)
+    return totals
+
+def cube_value(measure: str, total: int) -> float:
+    """A scanned total in the cube's units: euros for revenue (cents / 100), hours as they are."""
+    return total / 100 if measure == "revenue" else total
+
+def check_task_g_cube(work_dir: str, rows: int, seed: int) -> None:
+    """RevenueCube totals and roll-ups against a scan of the reservations, after every kind of change."""
+    module = load_module("task_g/task_g_class.py")
+    rng = random.Random(seed)
+    reservations = generated_reservations(module, work_dir, rows, seed)
+    store = module.ReservationStore(reservations)
+    next_id = max(reservation.reservation_id for reservation in reservations) + 1
+    for step in range(5):
+        live = list(store)
+        cube = store.cube()
+        days = sorted({reservation.date for reservation in live})
+        for resource in [None, "Unknown Room"] + cube.resources():
+            for confirmed in (None, True, False):
+                by_month = scanned_totals(live, lambda day: (day.year, day.month), resource, confirmed)
+                for index, measure in enumerate(cube.MEASURES):
+                    expected = {key: cube_value(measure, values[index]) for key, values in by_month.items()}
+                    rollup = cube.rollup("month", measure, resource, confirmed)
+                    rollup = {key: value for key, value in rollup.items() if value or key in expected}
+                    if rollup != expected:
+                        raise AssertionError(f"step {step}: monthly {measure} of {resource}/{confirmed} differ")
+                by_day = scanned_totals(live, lambda day: day, resource, confirmed)
+                for _ in range(20):
+                    start, end = sorted((rng.choice(days) + timedelta(days=rng.randint(-3, 3)),
+                                         rng.choice(days) + timedelta(days=rng.randint(-3, 3))))
+                    for index, measure in enumerate(cube.MEASURES):
+                        total = sum(values[index] for day, values in by_day.items() if start <= day <= end)
+                        if cube.total(measure, resource, confirmed, start, end) != cube_value(measure, total):
+                            raise AssertionError(f"step {step}: {measure} of {resource}/{confirmed} "
+                                                 f"{start}–{end} differs")
+        for reservation in rng.sample(live, len(live) // 10):
+            change = rng.randrange(4)
+            if change == 0:
+                store.remove(reservation.reservation_id)
+            elif change == 1:
+                store.update(reservation.reservation_id, confirmed=not reservation.confirmed)
+            elif change == 2:
+                store.update(reservation.reservation_id, price=rng.randrange(500, 5000) / 100,
+                             duration=rng.randint(1, 6))
+            else:
+                store.update(reservation.reservation_id, resource=f"Room {rng.randrange(3)}")
+        for _ in range(len(live) // 50):
+            # Days before and after the cube's arrays make it grow at both ends
+            added = copy(rng.choice(list(store)))
+            added.reservation_id = next_id
+            added.date = days[0 if rng.random() < 0.5 else -1] + timedelta(days=rng.choice((-40, -1, 1, 40)))
+            next_id += 1
+            store.add(added)
+
+# Check name: function(work_dir, rows, seed)
+CHECKS: Dict[str, Callable[[str, int, int], None]] = {
+    "task_d": check_task_d,
+    "task_f": check_task_f,
+    "task_f_partitions": check_task_f_partitions,
+    "task_g_cube": check_task_g_cube,
+    "task_g_schedule": check_task_g_schedule,
+}
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare the fast paths with the row loops")
+    parser.add_argument("--checks", nargs="+", choices=sorted(CHECKS), default=sorted(CHECKS))
+    parser.add_argument("--rows", type=lambda text: int(float(text)), default=5000)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    failed = 0
+    for name in args.checks:
+        with tempfile.TemporaryDirectory() as work_dir:
+            try:
+                CHECKS[name](work_dir, args.rows, args.seed)
+            except AssertionError as error:
+                failed += 1
+                print(f"{name}: FAILED ({error})")
+            else:
+                print(f"{name}: ok")
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
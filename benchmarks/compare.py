@@ -0,0 +1,302 @@
+# Copyright (c) 2026 Jony Ahammad
+# License: MIT
+
+"""
+Times code paths that earlier changes replaced against the current ones on
+generated input. Each replaced path is kept here as a small copy of the old
+code, so the comparison still runs after the old code is gone from the tasks.
+
+Usage:
+    python compare.py [--cases NAME ...] [--rows 1e5] [--seed N] [--output results.json]
+
+Every variant is run twice: once timed, and once under tracemalloc for the
+memory its result holds and the peak while loading.
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import tracemalloc
+from datetime import datetime, timedelta
+from time import perf_counter
+from typing import Callable, Dict, List
+
+from benchmark import input_file, load_module
+
+def measure(variant: str, load: Callable, use: Callable = None) -> Dict:
+    """Times load() and use(loaded), then measures the memory of load()."""
+    gc.collect()
+    started = perf_counter()
+    loaded = load()
+    load_seconds = perf_counter() - started
+    use_seconds = None
+    if use is not None:
+        started = perf_counter()
+        use(loaded)
+        use_seconds = round(perf_counter() - started, 6)
+    del loaded
+    gc.collect()
+    tracemalloc.start()
+    loaded = load()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del loaded
+    return {
+        "variant": variant,
+        "load_seconds": round(load_seconds, 6),
+        "use_seconds": use_seconds,
+        "bytes": current,
+        "peak_bytes": peak,
+    }
+
+# user-001: Task f rows as dicts (the old loader) against array columns
+
+def old_task_f_read_data(filename: str) -> List[Dict]:
+    """Task f's read_data before the columns: one dict per row, strptime per timestamp."""
+    data = []
+    with open(filename, "r", encoding="utf-8") as f:
+        next(f)  # skip header
+        for line in f:
+            parts = line.strip().split(";")
+            if len(parts) < 4:
+                continue
+            timestamp, consumption, production, temperature = parts[:4]
+            ts_clean = timestamp.split(".")[0].split("+")[0]
+            dt = datetime.strptime(ts_clean, "%Y-%m-%dT%H:%M:%S")
+            data.append({
+                "date": dt.date(),
+                "consumption": float(consumption.replace(",", ".")),
+                "production": float(production.replace(",", ".")),
+                "temperature": float(temperature.replace(",", "."))
+            })
+    return data
+
+def old_task_f_totals(rows: List[Dict]) -> tuple:
+    """The sums every old report computed from its filtered rows."""
+    return (sum(row["consumption"] for row in rows), sum(row["production"] for row in rows),
+            sum(row["temperature"] for row in rows) / len(rows) if rows else 0)
+
+def case_task_f_columns(rows: int, seed: int) -> List[Dict]:
+    """The year report, 12 month reports and 31 one-day reports from a year file."""
+    filename = input_file("year", rows, seed)
+    module = load_module("Task f/task_f.py")
+    first = datetime(2025, 1, 1).date()
+    days = [first + timedelta(days=day) for day in range(31)]
+
+    def old_reports(data: List[Dict]) -> None:
+        old_task_f_totals(data)
+        for month in range(1, 13):
+            old_task_f_totals([row for row in data if row["date"].month == month])
+        for day in days:
+            old_task_f_totals([row for row in data if day <= row["date"] <= day])
+
+    def new_reports(data) -> None:
+        index = module.build_day_index(data)
+        module.yearly_report(index)
+        for month in range(1, 13):
+            module.monthly_report(index, month)
+        for day in days:
+            text = day.strftime("%d.%m.%Y")
+            module.daily_report(index, text, text)
+
+    return [
+        measure("dict rows", lambda: old_task_f_read_data(filename), old_reports),
+        measure("array columns", lambda: module.read_data(filename, use_cache=False), new_reports),
+    ]
+
+# user-005: splitting off the milliseconds and offset for strptime against fromisoformat
+
+def case_timestamp_parsing(rows: int, seed: int) -> List[Dict]:
+    """Turns every timestamp of a Task f year file into its (day ordinal, hour) key."""
+    filename = input_file("year", rows, seed)
+    with open(filename, "r", encoding="utf-8") as f:
+        next(f)  # skip header
+        timestamps = [line.split(";", 1)[0] for line in f]
+
+    def old_parse(timestamp: str) -> datetime:
+        """Task f's parse before fromisoformat: the milliseconds and the offset were dropped."""
+        return datetime.strptime(timestamp.split(".")[0].split("+")[0], "%Y-%m-%dT%H:%M:%S")
+
+    def load(parse) -> List[tuple]:
+        return [(dt.toordinal(), dt.hour) for dt in map(parse, timestamps)]
+
+    if load(old_parse) != load(datetime.fromisoformat):
+        raise AssertionError("the parsers give different days or hours")
+    results = [
+        measure("split+strptime", lambda: load(old_parse)),
+        measure("fromisoformat", lambda: load(datetime.fromisoformat)),
+    ]
+    for result in results:
+        result["us_per_timestamp"] = round(result["load_seconds"] * 1e6 / max(1, len(timestamps)), 3)
+    return results
+
+# user-006: text lines split into str fields against the memory-mapped bytes reader
+
+def text_sums(filename: str, decimal_comma: bool) -> List[float]:
+    """Sums the numeric columns the way the readers did before mmap: decoded, stripped and split lines."""
+    sums = None
+    with open(filename, "r", encoding="utf-8") as f:
+        next(f)  # skip header
+        for line in f:
+            parts = line.strip().split(";")
+            if decimal_comma:
+                values = [float(part.replace(",", ".")) for part in parts[1:]]
+            else:
+                values = [int(part) for part in parts[1:]]
+            sums = values if sums is None else [a + b for a, b in zip(sums, values)]
+    return sums
+
+def bytes_sums(iter_fields, filename: str, decimal_comma: bool) -> List[float]:
+    """Sums the numeric columns from the bytes fields of iter_fields."""
+    sums = None
+    lines = iter_fields(filename)
+    next(lines, None)  # skip header
+    for parts in lines:
+        if decimal_comma:
+            values = [float(part.replace(b",", b".")) for part in parts[1:]]
+        else:
+            values = [int(part) for part in parts[1:]]
+        sums = values if sums is None else [a + b for a, b in zip(sums, values)]
+    return sums
+
+def case_mmap_reader(rows: int, seed: int) -> List[Dict]:
+    """One pass over a Task f year file (decimal commas) and a task_D week file (integers)."""
+    task_f = load_module("Task f/task_f.py")
+    task_d = load_module("task_D/task_d.py")
+    year = input_file("year", rows, seed)
+    week = input_file("week-en", rows, seed)
+    return [
+        measure("year text", lambda: text_sums(year, True)),
+        measure("year mmap", lambda: bytes_sums(task_f.iter_fields, year, True)),
+        measure("week text", lambda: text_sums(week, False)),
+        measure("week mmap", lambda: bytes_sums(task_d.iter_fields, week, False)),
+    ]
+
+# user-008: task_D's per-row daily totals against the totals from the array columns
+
+def case_daily_totals(rows: int, seed: int) -> List[Dict]:
+    """
+    task_D's daily totals of a week-en file. Both variants load through the
+    column cache like main (the first check writes it), so the difference is
+    the dict per row and the per-row aggregation.
+    """
+    module = load_module("task_D/task_d.py")
+    filename = input_file("week-en", rows, seed)
+    if (module.calculate_daily_totals(module.read_data(filename))
+            != module.calculate_daily_totals_from_columns(module.read_columns(filename))):
+        raise AssertionError("the daily totals differ")
+    return [
+        measure("row loop", lambda: module.read_data(filename), module.calculate_daily_totals),
+        measure("columns", lambda: module.read_columns(filename), module.calculate_daily_totals_from_columns),
+    ]
+
+# user-012: strptime per booking against the cached date and time parsers
+
+def case_reservation_parsing(rows: int, seed: int) -> List[Dict]:
+    """Converts every line of a reservations file into a task_g Reservation."""
+    module = load_module("task_g/task_g_class.py")
+    filename = input_file("reservations11", rows, seed)
+
+    def old_convert(data: List[str]):
+        """task_g's convert_reservation before the parse caches."""
+        return module.Reservation(
+            reservation_id=int(data[0]), name=data[1], email=data[2], phone=data[3],
+            date=datetime.strptime(data[4], "%Y-%m-%d").date(),
+            time=datetime.strptime(data[5], "%H:%M").time(),
+            duration=int(data[6]), price=float(data[7]),
+            confirmed=data[8].lower() == "true", resource=data[9],
+            created=datetime.fromisoformat(data[10]))
+
+    def load(convert) -> list:
+        # Every run starts with empty caches, so the hit rates are those of one file
+        module.parse_date.cache_clear()
+        module.parse_time.cache_clear()
+        with open(filename, "r", encoding="utf-8") as f:
+            return [convert(line.rstrip("\n").split("|")) for line in f]
+
+    results = [
+        measure("strptime", lambda: load(old_convert)),
+        measure("cached", lambda: load(module.convert_reservation)),
+    ]
+    for name, parse in (("parse_date", module.parse_date), ("parse_time", module.parse_time)):
+        info = parse.cache_info()
+        results[-1][name] = {"hits": info.hits, "misses": info.misses,
+                             "hit_rate": round(info.hits / max(1, info.hits + info.misses), 4)}
+    return results
+
+# user-016: strftime and f-string formatting against the cached Finnish formatters
+
+def case_formatting(rows: int, seed: int) -> List[Dict]:
+    """Renders task_D's daily table of a week-en file five times (one line per day)."""
+    module = load_module("task_D/task_d.py")
+    filename = input_file("week-en", rows, seed)
+
+    def old_print_report(daily_totals: Dict, stream) -> None:
+        """task_D's print_report with the formatting it had before the cached formatters."""
+        with module.ReportWriter(stream) as writer:
+            for d in sorted(daily_totals):
+                totals = daily_totals[d]
+                values = [f"{totals[key] / 1000:.2f}".replace(".", ",") for key in module.COLUMNS]
+                writer.write_line(f"{module.WEEKDAYS_FI_NAMES[d.weekday()]:<12} {d.strftime('%d.%m.%Y'):<12} "
+                                  + " ".join(f"{value:>7}" for value in values))
+
+    def render(print_report) -> Callable:
+        def use(daily_totals: Dict) -> None:
+            with open(os.devnull, "w", encoding="utf-8") as devnull:
+                for _ in range(5):
+                    print_report(daily_totals, devnull)
+        return use
+
+    def load() -> Dict:
+        return module.calculate_daily_totals_from_columns(module.read_columns(filename, use_cache=False))
+
+    return [
+        measure("strftime", load, render(old_print_report)),
+        measure("cached", load, render(module.print_report)),
+    ]
+
+# Case name: function(rows, seed) returning one result per variant
+CASES: Dict[str, Callable[[int, int], List[Dict]]] = {
+    "task_f_columns": case_task_f_columns,
+    "timestamp_parsing": case_timestamp_parsing,
+    "mmap_reader": case_mmap_reader,
+    "daily_totals": case_daily_totals,
+    "reservation_parsing": case_reservation_parsing,
+    "formatting": case_formatting,
+}
+
+def parse_args() -> argparse.Namespace:
+    """Parses the command line options."""
+    parser = argparse.ArgumentParser(description="Compare replaced code paths with the current ones")
+    parser.add_argument("--cases", nargs="+", choices=sorted(CASES), default=list(CASES))
+    parser.add_argument("--rows", type=lambda text: int(float(text)), default=100000,
+                        help="input rows (default 1e5)")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", help="JSON result file (default stdout)")
+    return parser.parse_args()
+
+def main() -> None:
+    args = parse_args()
+    results = {}
+    for name in args.cases:
+        print(f"{name} {args.rows} rows", file=sys.stderr)
+        results[name] = CASES[name](args.rows, args.seed)
+    text = json.dumps({
+        "started": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "rows": args.rows,
+        "seed": args.seed,
+        "results": results,
+    }, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+if __name__ == "__main__":
+    main()
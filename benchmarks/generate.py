@@ -0,0 +1,126 @@
+# Copyright (c) 2026 Jony Ahammad
+# License: MIT
+
+"""
+Seeded generators for large input files in the formats the tasks read.
+The same seed and row count always give the same file.
+
+Usage: python generate.py FORMAT ROWS OUTPUT [--seed N]
+"""
+
+import argparse
+import random
+from datetime import date, datetime, timedelta
+from typing import Iterator
+
+NAMES = ["Anna Virtanen", "Jony Ahammad", "Moomin Valley", "Snork Maiden", "Little My Storm",
+         "Matti Meikäläinen", "Liisa Korhonen", "Pekka Nieminen", "Sanna Mäkinen", "Olli Laine"]
+RESOURCES = ["Meeting Room A", "Meeting Room B", "Forest Area 1", "Flower Room", "Red Room",
+             "Sauna", "Tennis Court", "Conference Hall"]
+START_DATE = date(2025, 1, 1)
+START_TIME = datetime(2025, 1, 1)
+
+WEEK_HEADER_EN = ("Time;Consumption phase 1 Wh;Consumption phase 2 Wh;Consumption phase 3 Wh;"
+                  "Production phase 1 Wh;Production phase 2 Wh;Production phase 3 Wh")
+WEEK_HEADER_FI = ("Aika;Kulutus vaihe 1 Wh;Kulutus vaihe 2 Wh;Kulutus vaihe 3 Wh;"
+                  "Tuotanto vaihe 1 Wh;Tuotanto vaihe 2 Wh;Tuotanto vaihe 3 Wh")
+YEAR_HEADER = "Time; Consumption (net) kWh; Production (net) kWh; Daily average temperature"
+
+CHUNK_ROWS = 100000
+
+def _write(filename: str, header: str, lines) -> None:
+    """Writes the header (if any) and the lines, without a trailing newline like the fixtures."""
+    with open(filename, "w", encoding="utf-8") as f:
+        first = True
+        if header:
+            f.write(header)
+            first = False
+        chunk = []
+        for line in lines:
+            chunk.append(line)
+            if len(chunk) >= CHUNK_ROWS:
+                f.write(("" if first else "\n") + "\n".join(chunk))
+                first = False
+                chunk.clear()
+        if chunk:
+            f.write(("" if first else "\n") + "\n".join(chunk))
+
+def _email(name: str, i: int) -> str:
+    return f"{name.split()[0].lower()}.{i}@example.com"
+
+def short_reservations(rows: int, seed: int = 1) -> Iterator[str]:
+    """Yields 10-field lines for task A and taskb (id|name|date|time|hours|price|paid|venue|phone|email)."""
+    rng = random.Random(seed)
+    for i in range(1, rows + 1):
+        name = rng.choice(NAMES)
+        day = START_DATE + timedelta(days=rng.randrange(365))
+        yield (f"{i}|{name}|{day.isoformat()}|{rng.randrange(7, 21):02}:{rng.choice((0, 30)):02}|"
+               f"{rng.randint(1, 6)}|{rng.randrange(500, 5000) / 100:.2f}|{rng.random() < 0.6}|"
+               f"{rng.choice(RESOURCES)}|04{rng.randrange(10 ** 8):08}|{_email(name, i)}")
+
+def reservations(rows: int, seed: int = 1) -> Iterator[str]:
+    """
+    Yields 11-field lines for Task_C and task_g (id|name|email|phone|date|time|
+    hours|price|confirmed|resource|createdAt).
+    """
+    rng = random.Random(seed)
+    for i in range(1, rows + 1):
+        name = rng.choice(NAMES)
+        day = START_DATE + timedelta(days=rng.randrange(365))
+        created = START_TIME + timedelta(seconds=rng.randrange(365 * 86400))
+        yield (f"{i}|{name}|{_email(name, i)}|04{rng.randrange(10 ** 8):08}|{day.isoformat()}|"
+               f"{rng.randrange(7, 21):02}:{rng.choice((0, 30)):02}|{rng.randint(1, 6)}|"
+               f"{rng.randrange(500, 5000) / 100:.2f}|{rng.random() < 0.6}|{rng.choice(RESOURCES)}|"
+               f"{created.isoformat(' ')}")
+
+def week_rows(rows: int, seed: int = 1) -> Iterator[str]:
+    """Yields hourly 7-column meter lines (Wh per phase) for task_D and task_E."""
+    rng = random.Random(seed)
+    for hour in range(rows):
+        timestamp = START_TIME + timedelta(hours=hour)
+        sun = 6 <= timestamp.hour <= 18
+        yield (f"{timestamp.isoformat()};{rng.randrange(20, 600)};{rng.randrange(20, 600)};"
+               f"{rng.randrange(20, 600)};{rng.randrange(400) if sun else 0};"
+               f"{rng.randrange(400) if sun else 0};{rng.randrange(400) if sun else 0}")
+
+def year_rows(rows: int, seed: int = 1) -> Iterator[str]:
+    """Yields hourly Task f lines with decimal commas (kWh and daily temperature)."""
+    rng = random.Random(seed)
+    temperature = 0.0
+    for hour in range(rows):
+        timestamp = START_TIME + timedelta(hours=hour)
+        if timestamp.hour == 0:
+            temperature = rng.randrange(-250, 250) / 10
+        consumption = rng.randrange(200, 4000) / 1000
+        production = rng.randrange(3000) / 1000 if 6 <= timestamp.hour <= 18 else 0.0
+        values = f"{consumption:.3f};{production:.3f};{temperature:.1f}".replace(".", ",")
+        yield f"{timestamp.isoformat()}.000+02:00;{values}"
+
+# Format name: (line generator, header)
+FORMATS = {
+    "reservations10": (short_reservations, None),
+    "reservations11": (reservations, None),
+    "reservations11-header": (reservations, "|".join([
+        "reservationId", "name", "email", "phone", "reservationDate", "reservationTime",
+        "durationHours", "price", "confirmed", "reservedResource", "createdAt"])),
+    "week-en": (week_rows, WEEK_HEADER_EN),
+    "week-fi": (week_rows, WEEK_HEADER_FI),
+    "year": (year_rows, YEAR_HEADER),
+}
+
+def generate(file_format: str, rows: int, filename: str, seed: int = 1) -> None:
+    """Writes a file of the given format with rows data lines."""
+    lines, header = FORMATS[file_format]
+    _write(filename, header, lines(rows, seed))
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Generate benchmark input files")
+    parser.add_argument("format", choices=sorted(FORMATS))
+    parser.add_argument("rows", type=lambda text: int(float(text)), help="number of data lines (e.g. 1e6)")
+    parser.add_argument("output")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+    generate(args.format, args.rows, args.output, args.seed)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+# Copyright (c) 2026 Jony Ahammad
+# License: MIT
+
+"""
+Compares the memory used by reservations held in different forms, measured
+with tracemalloc after the records are built from generated lines:
+
+    dict     task_g_dict records (one 11-key dict each)
+    class    Reservation objects with a per-instance __dict__ (before __slots__)
+    slots    task_g_class Reservation objects (__slots__)
+    compact  one typed array per field (ReservationColumns below)
+
+Usage:
+    python memory.py [--forms dict class ...] [--sizes 1e4 1e6 1e7]
+                     [--seed N] [--output results.json]
+
+Every form and size is built in its own process. tracemalloc slows the
+building down several times; 1e7 records of the dict form need about 8 GB.
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import tracemalloc
+from array import array
+from datetime import datetime
+from time import perf_counter
+from typing import Dict, Iterable, List
+
+from benchmark import load_module
+from generate import reservations
+
+EPOCH = datetime(1970, 1, 1)
+
+class ReservationColumns:
+    """
+    Struct-of-arrays form of many reservations: a typed array per numeric field,
+    dates as ordinals, start times as minutes, created as epoch seconds and the
+    resource as an index into resource_names. Record i is read with the methods
+    below, which match the Reservation methods.
+    """
+
+    def __init__(self, parse_date, parse_time):
+        self.parse_date = parse_date
+        self.parse_time = parse_time
+        self.ids = array("q")
+        self.names: List[str] = []
+        self.emails: List[str] = []
+        self.phones: List[str] = []
+        self.days = array("l")
+        self.minutes = array("h")
+        self.durations = array("h")
+        self.prices = array("d")
+        self.confirmed = bytearray()
+        self.resources = array("h")
+        self.created = array("q")
+        self.resource_names: List[str] = []
+        self._resource_index: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def append(self, data: List[str]) -> None:
+        """Adds one reservation from its split line."""
+        start = self.parse_time(data[5])
+        self.ids.append(int(data[0]))
+        self.names.append(sys.intern(data[1]))
+        self.emails.append(data[2])
+        self.phones.append(data[3])
+        self.days.append(self.parse_date(data[4]).toordinal())
+        self.minutes.append(start.hour * 60 + start.minute)
+        self.durations.append(int(data[6]))
+        self.prices.append(float(data[7]))
+        self.confirmed.append(data[8].lower() == "true")
+        resource = self._resource_index.get(data[9])
+        if resource is None:
+            resource = self._resource_index[data[9]] = len(self.resource_names)
+            self.resource_names.append(data[9])
+        self.resources.append(resource)
+        self.created.append(int((datetime.fromisoformat(data[10]) - EPOCH).total_seconds()))
+
+    def is_confirmed(self, i: int) -> bool:
+        return bool(self.confirmed[i])
+
+    def is_long(self, i: int) -> bool:
+        return self.durations[i] >= 3
+
+    def total_price(self, i: int) -> float:
+        return self.durations[i] * self.prices[i]
+
+def build(form: str, module, lines: Iterable[str]):
+    """Returns the records of the lines in the given form (module is the task_g script to use)."""
+    if form in ("dict", "slots"):
+        return [module.convert_reservation(line.split("|")) for line in lines]
+    if form == "class":
+        class DictReservation:
+            """Reservation before __slots__: the same fields in a per-instance __dict__."""
+            __init__ = module.Reservation.__init__
+
+        records = []
+        for line in lines:
+            slotted = module.convert_reservation(line.split("|"))
+            records.append(DictReservation(*(getattr(slotted, name) for name in module.Reservation.__slots__)))
+        return records
+    columns = ReservationColumns(module.parse_date, module.parse_time)
+    for line in lines:
+        columns.append(line.split("|"))
+    return columns
+
+FORMS = ("dict", "class", "slots", "compact")
+
+def run_child(form: str, rows: int, seed: int) -> Dict:
+    """Builds one form in this process and returns its traced memory."""
+    module = load_module("task_g/task_g_dict.py" if form == "dict" else "task_g/task_g_class.py")
+    tracemalloc.start()
+    started = perf_counter()
+    records = build(form, module, reservations(rows, seed))
+    seconds = perf_counter() - started
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "form": form,
+        "rows": len(records),
+        "bytes": current,
+        "bytes_per_record": round(current / rows, 1) if rows else None,
+        "peak_bytes": peak,
+        "seconds": round(seconds, 6),
+    }
+
+def parse_args() -> argparse.Namespace:
+    """Parses the command line options."""
+    parser = argparse.ArgumentParser(description="Compare the memory of reservation forms")
+    parser.add_argument("--forms", nargs="+", choices=FORMS, default=list(FORMS))
+    parser.add_argument("--sizes", nargs="+", type=lambda text: int(float(text)),
+                        default=[10000, 1000000, 10000000], help="record counts (default 1e4 1e6 1e7)")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", help="JSON result file (default stdout)")
+    parser.add_argument("--child", nargs=2, metavar=("FORM", "ROWS"), help=argparse.SUPPRESS)
+    return parser.parse_args()
+
+def main() -> None:
+    args = parse_args()
+    if args.child:
+        form, rows = args.child
+        print(json.dumps(run_child(form, int(rows), args.seed)))
+        return
+
+    results = []
+    for rows in args.sizes:
+        for form in args.forms:
+            print(f"{form} {rows} records", file=sys.stderr)
+            child = subprocess.run(
+                [sys.executable, __file__, "--child", form, str(rows), "--seed", str(args.seed)],
+                capture_output=True, text=True)
+            if child.returncode != 0:
+                sys.exit(f"{form} failed at {rows} records:\n{child.stderr}")
+            results.append(json.loads(child.stdout))
+    text = json.dumps({
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": args.seed,
+        "results": results,
+    }, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+# Copyright (c) 2026 Jony Ahammad
+# License: MIT
+
+"""
+Measures how the task_E week report scales with the number of worker
+processes: the same set of generated week files is summarized and written
+with 1, 2, 4 and N (CPU count) workers.
+
+Usage:
+    python workers.py [--files 200] [--rows 168] [--workers 1 2 4 8]
+                      [--repeat 3] [--seed N] [--output results.json]
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import sys
+import tempfile
+from datetime import datetime
+from time import perf_counter
+from typing import Dict, List
+
+from benchmark import ROOT, input_file
+
+# Imported by name (not from its path) so the worker processes can unpickle
+# references to its functions
+sys.path.insert(0, os.path.join(ROOT, "task_E"))
+import task_e
+
+def time_report(filenames: List[str], workers: int, repeat: int) -> float:
+    """Returns the best wall time of main() over repeat runs, with its output discarded."""
+    best = None
+    previous = os.getcwd()
+    with tempfile.TemporaryDirectory() as work_dir, open(os.devnull, "w") as devnull:
+        os.chdir(work_dir)  # summary.txt is written here
+        try:
+            for _ in range(repeat):
+                started = perf_counter()
+                with contextlib.redirect_stdout(devnull):
+                    task_e.main(filenames, workers)
+                seconds = perf_counter() - started
+                best = seconds if best is None else min(best, seconds)
+        finally:
+            os.chdir(previous)
+    return best
+
+def run_scaling(files: int, rows: int, worker_counts: List[int], repeat: int, seed: int) -> Dict:
+    """Times the report over the same files at every worker count."""
+    # One file per meter: the same format and size, a different seed each
+    filenames = [input_file("week-fi", rows, seed + i) for i in range(files)]
+    results = []
+    for workers in worker_counts:
+        print(f"task_e {workers} workers", file=sys.stderr)
+        seconds = time_report(filenames, workers, repeat)
+        results.append({
+            "workers": workers,
+            "seconds": round(seconds, 6),
+            "files_per_second": round(files / seconds, 1),
+            "rows_per_second": round(files * rows / seconds),
+            "speedup": round(results[0]["seconds"] / seconds, 2) if results else 1.0,
+        })
+    return {
+        "started": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "files": files,
+        "rows": rows,
+        "seed": seed,
+        "results": results,
+    }
+
+def parse_args() -> argparse.Namespace:
+    """Parses the command line options."""
+    parser = argparse.ArgumentParser(description="Benchmark task_E with 1..N worker processes")
+    parser.add_argument("--files", type=int, default=200, help="number of week files (default 200)")
+    parser.add_argument("--rows", type=lambda text: int(float(text)), default=168,
+                        help="hourly rows per file (default 168, one week)")
+    parser.add_argument("--workers", nargs="+", type=int,
+                        help="worker counts (default 1 2 4 and the CPU count)")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per worker count, best is kept")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", help="JSON result file (default stdout)")
+    return parser.parse_args()
+
+def main() -> None:
+    args = parse_args()
+    worker_counts = args.workers or sorted({1, 2, 4, os.cpu_count() or 1})
+    report = run_scaling(args.files, args.rows, worker_counts, args.repeat, args.seed)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+if __name__ == "__main__":
+    main()
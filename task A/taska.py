@@ -1,6 +1,41 @@
+import argparse
+import os
+import sys
 from datetime import datetime
 
+# The helpers shared by the tasks are in task_common.py at the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from task_common import print_slips, read_reservations
+
+# Confirmation slip, the same text main prints for one reservation (the
+# --batch mode fills it with task_common.render_slip)
+SLIP_TEMPLATE = (
+    "Reservation number: {number}\n"
+    "Booker: {booker}\n"
+    "Date: {date}\n"
+    "Start time: {start_time}\n"
+    "Number of hours: {hours}\n"
+    "Hourly price: {price} €\n"
+    "Total price: {total} €\n"
+    "Paid: {paid}\n"
+    "Location: {location}\n"
+    "Phone: {phone}\n"
+    "Email: {email}"
+)
+
+def parse_args() -> argparse.Namespace:
+    # Parses the command line options
+    parser = argparse.ArgumentParser(description="Print reservation confirmation slips")
+    parser.add_argument("--batch", metavar="FILE",
+                        help="print a slip for every reservation in FILE")
+    return parser.parse_args()
+
 def main():
+    args = parse_args()
+    if args.batch:
+        print_slips(read_reservations(args.batch), SLIP_TEMPLATE)
+        return
+
     # File name
     filename = "reservations.txt"
 
@@ -1,29 +1,178 @@
-import csv
-from datetime import datetime, date
-from typing import List, Dict
+import argparse
+import hashlib
+import json
+import os
+import sys
+from array import array
+from bisect import bisect_left
+from datetime import datetime, date, timedelta
+from operator import gt
+from typing import List, Dict, Optional
+
+# The helpers shared by the tasks are in task_common.py at the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from task_common import (
+    ReportWriter, format_date_fi, format_decimal_fi, iter_fields, load_many,
+    profiler_from_env
+)
 
 # Finnish weekdays
 WEEKDAYS_FI = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
 WEEKDAYS_FI_NAMES = ["Maanantai", "Tiistai", "Keskiviikko", "Torstai", "Perjantai", "Lauantai", "Sunnuntai"]
 
+# CSV column for each value in a row
+COLUMNS = {
+    "cons_v1": "Consumption phase 1 Wh",
+    "cons_v2": "Consumption phase 2 Wh",
+    "cons_v3": "Consumption phase 3 Wh",
+    "prod_v1": "Production phase 1 Wh",
+    "prod_v2": "Production phase 2 Wh",
+    "prod_v3": "Production phase 3 Wh",
+}
+
+EPOCH = datetime(1970, 1, 1)
+
+PROFILER = profiler_from_env()
+
+CACHE_SUFFIX = ".cache"
+
+def file_hash(filename: str, size: int) -> str:
+    """Returns the SHA-256 hash of the first size bytes of a file."""
+    digest = hashlib.sha256()
+    with open(filename, "rb") as f:
+        while size > 0:
+            chunk = f.read(min(size, 1 << 20))
+            if not chunk:
+                break
+            digest.update(chunk)
+            size -= len(chunk)
+    return digest.hexdigest()
+
+def save_cache(filename: str, columns: Dict[str, array], stat: os.stat_result, sha256: str) -> None:
+    """
+    Writes the parsed columns next to the CSV file (<filename>.cache): one JSON
+    header line describing the source file as it was when parsed (stat and the
+    hash of the bytes parsed), then the raw bytes of each column.
+    """
+    header = {
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "sha256": sha256,
+        "byteorder": sys.byteorder,
+        "rows": len(next(iter(columns.values()))),
+        "columns": [[name, column.typecode] for name, column in columns.items()],
+    }
+    temp_name = filename + CACHE_SUFFIX + ".tmp"
+    with open(temp_name, "wb") as f:
+        f.write(json.dumps(header).encode("utf-8") + b"\n")
+        for column in columns.values():
+            column.tofile(f)
+    os.replace(temp_name, filename + CACHE_SUFFIX)
+
+def load_cache(filename: str) -> Optional[Dict[str, array]]:
+    """
+    Returns the cached columns of a CSV file, or None if there is no cache or the
+    file has changed since it was written (size, or mtime and content hash).
+    When only the mtime changed (the file was touched or copied), the cache is
+    written again with the new mtime, so later runs do not hash the file.
+    """
+    try:
+        with open(filename + CACHE_SUFFIX, "rb") as f:
+            header = json.loads(f.readline())
+            stat = os.stat(filename)
+            if header["size"] != stat.st_size or header["byteorder"] != sys.byteorder:
+                return None
+            touched = header["mtime_ns"] != stat.st_mtime_ns
+            if touched and header["sha256"] != file_hash(filename, stat.st_size):
+                return None
+            columns = {}
+            for name, typecode in header["columns"]:
+                column = array(typecode)
+                column.fromfile(f, header["rows"])
+                columns[name] = column
+    except (OSError, ValueError, KeyError, EOFError):
+        return None
+    if touched:
+        try:
+            save_cache(filename, columns, stat, header["sha256"])
+        except OSError:
+            pass
+    return columns
+
+@PROFILER.measure("read_columns", rows=lambda columns, *args: len(columns["time"]))
+def read_columns(filename: str, use_cache: bool = True) -> Dict[str, array]:
+    """
+    Reads the CSV file into columns: 'time' holds the local (wall-clock) time as
+    seconds since 1970-01-01 and each key of COLUMNS holds the Wh values as
+    32-bit integers. With use_cache the columns are loaded from (or saved to) a
+    binary cache next to the CSV.
+    """
+    if use_cache:
+        columns = load_cache(filename)
+        if columns is not None:
+            return columns
+
+    columns = {"time": array("q")}
+    for key in COLUMNS:
+        columns[key] = array("i")
+    # The file is parsed and hashed up to the size it had here, so the
+    # cache describes the bytes that were parsed even if it grows meanwhile
+    stat = os.stat(filename)
+    lines = iter_fields(filename, 0, stat.st_size)
+    header = [name.decode("utf-8-sig").strip() for name in next(lines, [])]
+    if header:
+        time_index = header.index("Time")
+        indexes = [(columns[key], header.index(column)) for key, column in COLUMNS.items()]
+        for parts in lines:
+            if len(parts) < len(header):
+                continue  # skip blank lines
+            # Aware timestamps (+02:00) keep their wall-clock time, so the
+            # days are the local days like in the CSV
+            timestamp = datetime.fromisoformat(parts[time_index].decode()).replace(tzinfo=None)
+            columns["time"].append(int((timestamp - EPOCH).total_seconds()))
+            for column, i in indexes:
+                column.append(int(parts[i]))
+
+    if use_cache:
+        try:
+            save_cache(filename, columns, stat, file_hash(filename, stat.st_size))
+        except OSError:
+            pass  # the report works without a cache
+    return columns
+
+@PROFILER.measure("read_data", rows=lambda rows, *args: len(rows))
 def read_data(filename: str) -> List[Dict]:
-   
+    """
+    Reads the CSV file and returns one dictionary per row. The timestamps are
+    naive local times, also when the CSV has a UTC offset.
+    """
+    columns = read_columns(filename)
     rows = []
-    with open(filename, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f, delimiter=";")
-        for line in reader:
-            row = {
-                "timestamp": datetime.fromisoformat(line["Time"]),
-                "cons_v1": int(line["Consumption phase 1 Wh"]),
-                "cons_v2": int(line["Consumption phase 2 Wh"]),
-                "cons_v3": int(line["Consumption phase 3 Wh"]),
-                "prod_v1": int(line["Production phase 1 Wh"]),
-                "prod_v2": int(line["Production phase 2 Wh"]),
-                "prod_v3": int(line["Production phase 3 Wh"]),
-            }
-            rows.append(row)
+    for i, seconds in enumerate(columns["time"]):
+        row = {"timestamp": EPOCH + timedelta(seconds=seconds)}
+        for key in COLUMNS:
+            row[key] = columns[key][i]
+        rows.append(row)
     return rows
 
+def read_many(filenames: List[str], limit: int = 8) -> Dict[str, array]:
+    """
+    Reads several CSV files concurrently (at most limit at a time, see
+    task_common.load_many) and joins their columns in file order. The rows of
+    all meters of a day are summed together.
+    """
+    parts = load_many(read_columns, filenames, limit)
+    if len(parts) == 1:
+        return parts[0]
+    columns = {"time": array("q")}
+    for key in COLUMNS:
+        columns[key] = array("i")
+    for part in parts:
+        for key, column in part.items():
+            columns[key].extend(column)
+    return columns
+
+@PROFILER.measure("calculate_daily_totals", rows=lambda totals, rows: len(rows))
 def calculate_daily_totals(rows: List[Dict]) -> Dict[date, Dict[str, float]]:
     
 
@@ -44,44 +193,81 @@ def calculate_daily_totals(rows: List[Dict]) -> Dict[date, Dict[str, float]]:
         daily_totals[d]["prod_v3"] += row["prod_v3"]
     return daily_totals
 
-def print_report(daily_totals: Dict[date, Dict[str, float]]) -> None:
+@PROFILER.measure("calculate_daily_totals_from_columns",
+                  rows=lambda totals, columns: len(columns["time"]))
+def calculate_daily_totals_from_columns(columns: Dict[str, array]) -> Dict[date, Dict[str, float]]:
+    """
+    Calculates the same daily totals as calculate_daily_totals from the columns
+    returned by read_columns. Each day is found with a binary search and every
+    phase column is summed one day slice at a time, so rows that are not in time
+    order are sorted first.
+    """
+    daily_totals = {}
+    times = columns["time"]
+    if any(map(gt, times, times[1:])):
+        order = sorted(range(len(times)), key=times.__getitem__)
+        columns = {key: array(column.typecode, [column[i] for i in order])
+                   for key, column in columns.items()}
+        times = columns["time"]
+    start = 0
+    while start < len(times):
+        day = times[start] // 86400
+        end = bisect_left(times, (day + 1) * 86400, start)
+        d = (EPOCH + timedelta(days=day)).date()
+        totals = daily_totals.setdefault(d, dict.fromkeys(COLUMNS, 0))
+        for key in COLUMNS:
+            totals[key] += sum(columns[key][start:end])
+        start = end
+    return daily_totals
+
+@PROFILER.measure("print_report", rows=lambda result, daily_totals, *args: len(daily_totals))
+def print_report(daily_totals: Dict[date, Dict[str, float]], stream=None) -> None:
     """
     Prints a user-friendly report of daily electricity consumption and production.
 
     Parameters:
         daily_totals (Dict[date, Dict[str, float]]): Daily totals in Wh
+        stream: where to write the report (stdout by default)
     """
-    print("Week 42 electricity consumption and production (kWh, by phase)\n")
-    print(f"{'Day':<12} {'Date':<12} {'Consumption [kWh]':<30} {'Production [kWh]':<25}")
-    print(f"{'':<24} {'v1':>7} {'v2':>7} {'v3':>7} {'v1':>7} {'v2':>7} {'v3':>7}")
-    print("-" * 80)
-
-    # Sort by date
-    sorted_dates = sorted(daily_totals.keys())
-    for d in sorted_dates:
-        weekday_index = d.weekday()  
-        weekday_name_fi = WEEKDAYS_FI_NAMES[weekday_index]
-
-        totals = daily_totals[d]
-        # Convert Wh → kWh 
-        cons_v1 = f"{totals['cons_v1']/1000:.2f}".replace(".", ",")
-        cons_v2 = f"{totals['cons_v2']/1000:.2f}".replace(".", ",")
-        cons_v3 = f"{totals['cons_v3']/1000:.2f}".replace(".", ",")
-        prod_v1 = f"{totals['prod_v1']/1000:.2f}".replace(".", ",")
-        prod_v2 = f"{totals['prod_v2']/1000:.2f}".replace(".", ",")
-        prod_v3 = f"{totals['prod_v3']/1000:.2f}".replace(".", ",")
-
-        print(f"{weekday_name_fi:<12} {d.strftime('%d.%m.%Y'):<12} "
-              f"{cons_v1:>7} {cons_v2:>7} {cons_v3:>7} "
-              f"{prod_v1:>7} {prod_v2:>7} {prod_v3:>7}")
+    with ReportWriter(stream) as writer:
+        writer.write_line("Week 42 electricity consumption and production (kWh, by phase)\n")
+        writer.write_line(f"{'Day':<12} {'Date':<12} {'Consumption [kWh]':<30} {'Production [kWh]':<25}")
+        writer.write_line(f"{'':<24} {'v1':>7} {'v2':>7} {'v3':>7} {'v1':>7} {'v2':>7} {'v3':>7}")
+        writer.write_line("-" * 80)
+
+        # Sort by date
+        sorted_dates = sorted(daily_totals.keys())
+        for d in sorted_dates:
+            weekday_index = d.weekday()
+            weekday_name_fi = WEEKDAYS_FI_NAMES[weekday_index]
+
+            totals = daily_totals[d]
+            # Convert Wh → kWh
+            cons_v1 = format_decimal_fi(totals['cons_v1'] / 1000)
+            cons_v2 = format_decimal_fi(totals['cons_v2'] / 1000)
+            cons_v3 = format_decimal_fi(totals['cons_v3'] / 1000)
+            prod_v1 = format_decimal_fi(totals['prod_v1'] / 1000)
+            prod_v2 = format_decimal_fi(totals['prod_v2'] / 1000)
+            prod_v3 = format_decimal_fi(totals['prod_v3'] / 1000)
+
+            writer.write_line(f"{weekday_name_fi:<12} {format_date_fi(d):<12} "
+                              f"{cons_v1:>7} {cons_v2:>7} {cons_v3:>7} "
+                              f"{prod_v1:>7} {prod_v2:>7} {prod_v3:>7}")
+
+def parse_args() -> argparse.Namespace:
+    """Parses the command line options."""
+    parser = argparse.ArgumentParser(description="Daily electricity report")
+    parser.add_argument("files", nargs="*", default=["week42.csv"],
+                        help="week CSV files, read concurrently and reported together (default week42.csv)")
+    return parser.parse_args()
 
 def main() -> None:
     
     # Main function: reads data, computes daily totals and prints report
     
-    filename = "week42.csv"
-    rows = read_data(filename)
-    daily_totals = calculate_daily_totals(rows)
+    args = parse_args()
+    columns = read_many(args.files)
+    daily_totals = calculate_daily_totals_from_columns(columns)
     print_report(daily_totals)
 
 if __name__ == "__main__":
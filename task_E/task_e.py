@@ -1,34 +1,48 @@
 # Copyright (c) 2026 Jony Ahammad
 # License: MIT
 
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, date
-from typing import List, Dict
+from itertools import repeat
+from typing import List, Dict, Iterable, Iterator
+
+# The helpers shared by the tasks are in task_common.py at the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from task_common import (
+    CPROFILE_ENV, PROFILE_ENV, BlockHashes, complete_end, format_date_fi, format_decimal_fi, iter_fields,
+    profiler_from_env
+)
 
 WEEKDAYS_FI = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
 WEEKDAYS_FI = ["Maanantai", "Tiistai", "Keskiviikko", "Torstai", "Perjantai", "Lauantai", "Sunnuntai"]
 
-def read_data(filename: str) -> List[Dict]:
+PROFILER = profiler_from_env(main_process_only=True)
+
+def read_data(filename: str) -> Iterator[Dict]:
     """
-    Reads a CSV file with semicolon separators and returns a list of dictionaries.
+    Reads a CSV file with semicolon separators and yields one dictionary per row,
+    so the rows can be summarized without keeping the whole file in memory.
     Each dictionary contains:
       - 'timestamp': datetime object
       - 'consumption': list of 3 floats (Wh)
       - 'production': list of 3 floats (Wh)
     """
-    data = []
-    with open(filename, "r", encoding="utf-8") as file:
-        next(file)  # skip header
-        for line in file:
-            parts = line.strip().split(";")
-            ts = datetime.fromisoformat(parts[0])
-            consumption = [float(parts[1]), float(parts[2]), float(parts[3])]
-            production = [float(parts[4]), float(parts[5]), float(parts[6])]
-            data.append({"timestamp": ts, "consumption": consumption, "production": production})
-    return data
+    lines = iter_fields(filename)
+    next(lines, None)  # skip header
+    for parts in lines:
+        ts = datetime.fromisoformat(parts[0].decode())
+        consumption = [float(parts[1]), float(parts[2]), float(parts[3])]
+        production = [float(parts[4]), float(parts[5]), float(parts[6])]
+        yield {"timestamp": ts, "consumption": consumption, "production": production}
 
-def daily_summary(data: List[Dict]) -> List[Dict]:
+def daily_summary(data: Iterable[Dict]) -> List[Dict]:
     """
-    Calculates daily totals for consumption and production (in kWh) from the data list.
+    Calculates daily totals for consumption and production (in kWh) in a single
+    pass over the rows (a list or the generator returned by read_data).
     Returns a list of dictionaries:
       - 'weekday': Finnish weekday name
       - 'date': date object
@@ -72,11 +86,12 @@ def format_row(day_summary: Dict) -> str:
     """
     Formats a single day summary dictionary as a table row string with Finnish formatting.
     """
-    date_str = f"{day_summary['date'].day:02}.{day_summary['date'].month:02}.{day_summary['date'].year}"
-    cons_str = "   ".join(f"{v:.2f}".replace(".", ",") for v in day_summary["consumption"])
-    prod_str = "   ".join(f"{v:.2f}".replace(".", ",") for v in day_summary["production"])
+    date_str = format_date_fi(day_summary["date"])
+    cons_str = "   ".join(map(format_decimal_fi, day_summary["consumption"]))
+    prod_str = "   ".join(map(format_decimal_fi, day_summary["production"]))
     return f"{day_summary['weekday']:<10} {date_str}   {cons_str:<10}   {prod_str}"
 
+@PROFILER.measure("write_report", rows=lambda result, weeks_data: sum(map(len, weeks_data.values())))
 def write_report(weeks_data: Dict[str, List[Dict]]) -> None:
     """
     Writes the summaries of all weeks to 'summary.txt' in a clear table format.
@@ -91,16 +106,162 @@ def write_report(weeks_data: Dict[str, List[Dict]]) -> None:
                 f.write(format_row(day_summary) + "\n")
             f.write("\n")
 
-def main() -> None:
+def week_label(filename: str) -> str:
+    """Returns the week number from a file name such as 'week41.csv'."""
+    name = os.path.splitext(os.path.basename(filename))[0]
+    digits = "".join(ch for ch in name if ch.isdigit())
+    return digits or name
+
+def unique_label(filename: str, taken) -> str:
+    """
+    Returns a report label for a file that is not in taken: the week number,
+    else the relative path (the same week from another meter), else the path
+    with a running number.
+    """
+    label = week_label(filename)
+    if label not in taken:
+        return label
+    label = os.path.relpath(filename)
+    number = 2
+    candidate = label
+    while candidate in taken:
+        candidate = f"{label} ({number})"
+        number += 1
+    return candidate
+
+STATE_SUFFIX = ".state"
+
+def load_state(filename: str):
     """
-    Main function: reads CSV files for weeks 41-43, computes daily summaries, and writes report to summary.txt
+    Returns the saved incremental state of a week file and the BlockHashes of
+    the bytes it covers, or an empty state if there is none or the file was
+    truncated or rewritten since it was saved (its first or last block).
     """
-    files = {"41": "week41.csv", "42": "week42.csv", "43": "week43.csv"}
+    try:
+        with open(filename + STATE_SUFFIX, "r", encoding="utf-8") as f:
+            state = json.load(f)
+        hashes = BlockHashes(state["blocks"], state["offset"])
+        if hashes.check(filename):
+            return state, hashes
+    except (OSError, ValueError, KeyError):
+        pass
+    return {"offset": 0, "blocks": [], "days": {}}, BlockHashes()
+
+def save_state(filename: str, state: Dict) -> None:
+    """Writes the incremental state of a week file to <filename>.state."""
+    temp_name = filename + STATE_SUFFIX + ".tmp"
+    with open(temp_name, "w", encoding="utf-8") as f:
+        json.dump(state, f)
+    os.replace(temp_name, filename + STATE_SUFFIX)
+
+def add_lines(lines: Iterable[List[bytes]], days: Dict[str, List[float]]) -> None:
+    """Adds the Wh values of the lines to the per-day totals (ISO date -> 6 floats)."""
+    for parts in lines:
+        if len(parts) < 7:
+            continue  # skip blank lines
+        day = datetime.fromisoformat(parts[0].decode()).date().isoformat()
+        totals = days.setdefault(day, [0, 0, 0, 0, 0, 0])
+        for i in range(6):
+            totals[i] += float(parts[i + 1])
+
+@PROFILER.measure("summarize_incremental", rows=lambda summary, *args: len(summary))
+def summarize_incremental(filename: str) -> List[Dict]:
+    """
+    Returns the daily summary of a week file that grows by appended rows.
+    The byte offset read so far, the block hashes of those bytes and the
+    running per-day totals (Wh) are kept in <filename>.state, so each run
+    parses only the lines added since the last one. A last line without a newline is counted in the
+    summary but left out of the state until it is complete.
+    """
+    state, hashes = load_state(filename)
+    size = os.path.getsize(filename)
+    start = state["offset"]
+    end = complete_end(filename, start, size)
+    days = state["days"]
+    if end > start:
+        lines = iter_fields(filename, start, end)
+        if start == 0:
+            next(lines, None)  # skip header
+        add_lines(lines, days)
+        hashes.extend(filename, end)
+        state["offset"] = end
+        state["blocks"] = hashes.hashes
+        try:
+            save_state(filename, state)
+        except OSError:
+            pass  # the next run starts from the beginning
+
+    if 0 < end < size:
+        pending = {day: list(totals) for day, totals in days.items()}
+        try:
+            add_lines(iter_fields(filename, end, size), pending)
+        except ValueError:
+            pass  # the last line is not complete yet
+        else:
+            days = pending
+
+    summary = []
+    for day, totals in days.items():
+        current_day = date.fromisoformat(day)
+        summary.append({
+            "weekday": WEEKDAYS_FI[current_day.weekday()],
+            "date": current_day,
+            "consumption": [v / 1000 for v in totals[:3]],
+            "production": [v / 1000 for v in totals[3:]]
+        })
+    return summary
+
+def summarize_file(filename: str, incremental: bool = False) -> List[Dict]:
+    """
+    Reads one week file and returns its daily summary. Rows are read, converted
+    and summed in one stream, so they are profiled as one stage.
+    """
+    if incremental:
+        return summarize_incremental(filename)
+    if not PROFILER.enabled:
+        return daily_summary(read_data(filename))
+    with PROFILER.stage("read_data+daily_summary") as record:
+        return daily_summary(PROFILER.count(read_data(filename), record))
+
+def summarize_files(filenames: List[str], workers: int = 1, incremental: bool = False) -> List[List[Dict]]:
+    """
+    Returns the daily summaries of the given files in the same order.
+    With more than one worker the files are processed in parallel processes.
+    """
+    if workers <= 1 or len(filenames) <= 1:
+        return [summarize_file(filename, incremental) for filename in filenames]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(summarize_file, filenames, repeat(incremental)))
+
+def parse_args() -> argparse.Namespace:
+    """Parses the command line options."""
+    parser = argparse.ArgumentParser(description="Weekly electricity summary report")
+    parser.add_argument("files", nargs="*", default=["week41.csv", "week42.csv", "week43.csv"],
+                        help="week CSV files to summarize")
+    parser.add_argument("-w", "--workers", type=int, default=1,
+                        help="number of worker processes (default 1)")
+    parser.add_argument("-i", "--incremental", action="store_true",
+                        help="parse only the rows appended since the previous run")
+    parser.add_argument("--profile", metavar="JSON",
+                        help=f"write a timing report (same as {PROFILE_ENV}=JSON)")
+    parser.add_argument("--cprofile", metavar="STATS",
+                        help=f"also save cProfile stats (same as {CPROFILE_ENV}=STATS)")
+    return parser.parse_args()
+
+def main(filenames: List[str] = None, workers: int = 1, incremental: bool = False) -> None:
+    """
+    Main function: reads the given week CSV files (weeks 41-43 by default, or the
+    files named on the command line), computes daily summaries, and writes report to summary.txt
+    """
+    if filenames is None:
+        args = parse_args()
+        filenames, workers, incremental = args.files, args.workers, args.incremental
+        if args.profile or args.cprofile:
+            PROFILER.start(args.profile, args.cprofile)
     weeks_data = {}
-    for week, filename in files.items():
-        data = read_data(filename)
-        weeks_data[week] = daily_summary(data)
-    
+    for filename, summary in zip(filenames, summarize_files(filenames, workers, incremental)):
+        weeks_data[unique_label(filename, weeks_data)] = summary
+
     write_report(weeks_data)
     print("Report generated: summary.txt")
 
@@ -0,0 +1,391 @@
+# Copyright (c) 2026 Jony Ahammad
+# License: MIT
+
+"""
+Helpers shared by the task scripts: the stage profiler, the cached date and
+time parsers, the Finnish formatters, the block-buffered report writer, the
+reservation slips of the task A and B batch mode, the concurrent file loader,
+the memory-mapped CSV field reader and the block hashes that let a cache
+follow a growing file. The scripts put the
+repository root on sys.path and import what they need from here.
+"""
+
+import asyncio
+import atexit
+import cProfile
+import hashlib
+import json
+import mmap
+import multiprocessing
+import os
+import sys
+import threading
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime, date, time
+from functools import lru_cache, wraps
+from time import perf_counter
+from typing import Dict, Iterable, Iterator, List
+
+PROFILE_ENV = "TASK_PROFILE"  # path of the JSON timing report
+CPROFILE_ENV = "TASK_PROFILE_CPROFILE"  # path of the cProfile stats (optional)
+
+class Profiler:
+    """
+    Records the wall time, row count, rows/s and peak traced memory of each
+    stage once started (TASK_PROFILE=report.json). While it is off a measured
+    function costs one extra call and a flag check. Stages that run at the same
+    time in several threads share one memory peak.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.stages = []
+        self.local = threading.local()
+
+    def start(self, path: str = None, cprofile_path: str = None) -> None:
+        """Starts recording. The JSON report and cProfile stats are written at exit."""
+        if self.enabled:
+            return
+        self.enabled = True
+        self.path = path
+        self.cprofile = None
+        self.started = perf_counter()
+        tracemalloc.start()
+        if cprofile_path:
+            self.cprofile = cProfile.Profile()
+            self.cprofile.enable()
+            self.cprofile_path = cprofile_path
+        atexit.register(self.finish)
+
+    def finish(self) -> None:
+        """Stops recording and writes the report files."""
+        if not self.enabled:
+            return
+        self.enabled = False
+        tracemalloc.stop()
+        if self.cprofile is not None:
+            self.cprofile.disable()
+            self.cprofile.dump_stats(self.cprofile_path)
+        if self.path:
+            report = {
+                "script": os.path.basename(sys.argv[0]),
+                "seconds": round(perf_counter() - self.started, 6),
+                "stages": self.stages,
+            }
+            with open(self.path, "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=2)
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[Dict]:
+        """Measures the with-block as one stage. Set record["rows"] to get rows/s."""
+        record = {"stage": name, "rows": None}
+        if not self.enabled:
+            yield record
+            return
+        peaks = self.local.__dict__.setdefault("peaks", [])  # of the enclosing stages
+        if peaks:
+            peaks[-1] = max(peaks[-1], tracemalloc.get_traced_memory()[1])
+        peaks.append(0)
+        tracemalloc.reset_peak()
+        started = perf_counter()
+        try:
+            yield record
+        finally:
+            seconds = perf_counter() - started
+            peak = max(peaks.pop(), tracemalloc.get_traced_memory()[1])
+            if peaks:
+                peaks[-1] = max(peaks[-1], peak)
+            record["seconds"] = round(seconds, 6)
+            if record["rows"] is not None and seconds > 0:
+                record["rows_per_second"] = round(record["rows"] / seconds)
+            record["peak_bytes"] = peak
+            self.stages.append(record)
+
+    def measure(self, name: str, rows=None):
+        """
+        Decorator that records every call of a function as a stage. rows(result,
+        *args) returns the number of rows the call handled.
+        """
+        def decorate(func):
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                with self.stage(name) as record:
+                    result = func(*args, **kwargs)
+                    if rows is not None:
+                        record["rows"] = rows(result, *args)
+                return result
+            return wrapper
+        return decorate
+
+    def count(self, rows: Iterable, record: Dict) -> Iterator:
+        """Yields the rows unchanged and counts them in record["rows"]."""
+        record["rows"] = 0
+        for row in rows:
+            record["rows"] += 1
+            yield row
+
+def profiler_from_env(main_process_only: bool = False) -> Profiler:
+    """
+    Returns the profiler of a script, started when TASK_PROFILE or
+    TASK_PROFILE_CPROFILE is set. With main_process_only the worker processes,
+    which inherit the environment, are left unprofiled.
+    """
+    profiler = Profiler()
+    path, cprofile_path = os.environ.get(PROFILE_ENV), os.environ.get(CPROFILE_ENV)
+    if not (path or cprofile_path):
+        return profiler
+    if main_process_only and multiprocessing.parent_process() is not None:
+        return profiler
+    profiler.start(path, cprofile_path)
+    return profiler
+
+@lru_cache(maxsize=4096)
+def parse_date(text: str) -> date:
+    """
+    Parses a YYYY-MM-DD date. Booking files repeat the same dates, so results
+    are cached (parse_date.cache_info() shows the hit rate). fromisoformat is
+    used only for the fixed-width form, since it also accepts 20251112 and
+    2025-W46-3; anything else goes to strptime, which accepts what it did.
+    """
+    if len(text) == 10 and text[4] == text[7] == "-":
+        try:
+            return date.fromisoformat(text)
+        except ValueError:
+            pass
+    return datetime.strptime(text, "%Y-%m-%d").date()
+
+@lru_cache(maxsize=1024)
+def parse_time(text: str) -> time:
+    """Parses an HH:MM start time, cached and guarded like parse_date (fromisoformat accepts 09)."""
+    if len(text) == 5 and text[2] == ":":
+        try:
+            return time.fromisoformat(text)
+        except ValueError:
+            pass
+    return datetime.strptime(text, "%H:%M").time()
+
+@lru_cache(maxsize=4096)
+def format_date_fi(day: date) -> str:
+    """Formats a date as dd.mm.yyyy. Each day is formatted only once (cached)."""
+    return f"{day.day:02}.{day.month:02}.{day.year}"
+
+@lru_cache(maxsize=1440)
+def format_time_fi(value: time) -> str:
+    """Formats a time as hh.mm, cached like format_date_fi."""
+    return value.strftime("%H.%M")
+
+def format_decimal_fi(value: float) -> str:
+    """Formats a number with two decimals and a decimal comma (1,23)."""
+    return ("%.2f" % value).replace(".", ",")
+
+class ReportWriter:
+    """
+    Collects report lines and writes them to a stream (stdout by default) in
+    large blocks instead of one print call per line. Use it as a context
+    manager so the last block is written at the end.
+    """
+
+    def __init__(self, stream=None, flush_lines: int = 10000):
+        self.stream = stream if stream is not None else sys.stdout
+        self.flush_lines = flush_lines
+        self.lines = []
+
+    def __enter__(self) -> "ReportWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.flush()
+
+    def write_line(self, line: str = "") -> None:
+        """Adds one line (without the newline)."""
+        self.lines.append(line)
+        if len(self.lines) >= self.flush_lines:
+            self.flush()
+
+    def flush(self) -> None:
+        """Writes the collected lines to the stream."""
+        if self.lines:
+            self.lines.append("")
+            self.stream.write("\n".join(self.lines))
+            self.lines.clear()
+
+def parse_reservation(line: str) -> Dict:
+    """
+    Parses a number|booker|date|start time|hours|hourly price|paid|location|
+    phone|email line into a record, converting each field once.
+    """
+    fields = line.split("|")
+    return {
+        "number": int(fields[0]),
+        "booker": fields[1],
+        "date": parse_date(fields[2]),
+        "start_time": parse_time(fields[3]),
+        "hours": int(fields[4]),
+        "price": float(fields[5]),
+        "paid": fields[6] == "True",
+        "location": fields[7],
+        "phone": fields[8],
+        "email": fields[9],
+    }
+
+def read_reservations(filename: str) -> Iterator[Dict]:
+    """Yields the reservations of a file one line at a time (blank lines are skipped)."""
+    with open(filename, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield parse_reservation(line)
+
+def render_slip(reservation: Dict, template: str) -> str:
+    """
+    Fills a slip template for one reservation. The template has the labels of
+    its script and the fields {number}, {booker}, {date}, {start_time},
+    {hours}, {price}, {total}, {paid}, {location}, {phone} and {email}.
+    """
+    return template.format(
+        number=reservation["number"],
+        booker=reservation["booker"],
+        date=format_date_fi(reservation["date"]),
+        start_time=format_time_fi(reservation["start_time"]),
+        hours=reservation["hours"],
+        price=format_decimal_fi(reservation["price"]),
+        total=format_decimal_fi(reservation["hours"] * reservation["price"]),
+        paid="Yes" if reservation["paid"] else "No",
+        location=reservation["location"],
+        phone=reservation["phone"],
+        email=reservation["email"],
+    )
+
+def print_slips(reservations: Iterable[Dict], template: str, stream=None, flush_slips: int = 1000) -> int:
+    """
+    Writes a slip for every reservation (separated by blank lines) in large
+    blocks instead of one print per line, and returns the number of slips.
+    """
+    stream = stream if stream is not None else sys.stdout
+    block = []
+    count = 0
+    for reservation in reservations:
+        block.append(render_slip(reservation, template))
+        count += 1
+        if len(block) >= flush_slips:
+            stream.write(("\n" if count > len(block) else "") + "\n\n".join(block) + "\n")
+            block.clear()
+    if block:
+        stream.write(("\n" if count > len(block) else "") + "\n\n".join(block) + "\n")
+    return count
+
+def load_many(loader, filenames: List[str], limit: int = 8) -> list:
+    """
+    Returns loader(filename) for every file, in file order. Several files are
+    loaded in worker threads, at most limit at a time. Each loader parses its
+    file line by line while it reads it, so on slow network storage the files
+    are parsed as their data arrives and the wall time follows the slowest file
+    instead of the sum. A single file is loaded directly.
+    """
+    if len(filenames) <= 1:
+        return [loader(filename) for filename in filenames]
+
+    async def load_all() -> list:
+        semaphore = asyncio.Semaphore(limit)
+        loop = asyncio.get_running_loop()
+        with ThreadPoolExecutor(max_workers=limit) as executor:
+
+            async def load(filename: str):
+                async with semaphore:
+                    return await loop.run_in_executor(executor, loader, filename)
+
+            return await asyncio.gather(*(load(filename) for filename in filenames))
+
+    return asyncio.run(load_all())
+
+def iter_fields(filename: str, start: int = 0, end: int = None) -> Iterator[List[bytes]]:
+    """
+    Yields the ';'-separated fields of every line between byte offsets start and
+    end (the whole file by default, header first) as bytes. The file is
+    memory-mapped and the lines are never decoded to str.
+    """
+    with open(filename, "rb") as f:
+        if end is None:
+            end = os.fstat(f.fileno()).st_size
+        if end <= start:
+            return
+        with mmap.mmap(f.fileno(), end, access=mmap.ACCESS_READ) as mm:
+            mm.seek(start)
+            for line in iter(mm.readline, b""):
+                yield line.split(b";")
+
+def complete_end(filename: str, start: int, end: int) -> int:
+    """
+    Returns the offset just after the last newline between start and end, or
+    start if there is none. A final line without a newline may still be being
+    written, so only the bytes before this offset are cached.
+    """
+    if end <= start:
+        return start
+    with open(filename, "rb") as f:
+        with mmap.mmap(f.fileno(), end, access=mmap.ACCESS_READ) as mm:
+            return mm.rfind(b"\n", start, end) + 1 or start
+
+HASH_BLOCK = 1 << 18  # bytes per block hash
+
+class BlockHashes:
+    """
+    SHA-256 hashes of the first size bytes of a file, one per HASH_BLOCK-byte
+    block (the last one may be partial). A file that only grows keeps its
+    earlier blocks, so a cache of its first bytes is checked by hashing the
+    first and the last block again, and extend() hashes only the new bytes.
+    The digest of the partial last block is kept while the process runs, so
+    its bytes are read again at most once.
+    """
+
+    def __init__(self, hashes: List[str] = None, size: int = 0):
+        self.hashes = list(hashes or [])
+        self.size = size
+        self.tail = None  # digest of the partial last block, once known
+
+    def check(self, filename: str) -> bool:
+        """Returns whether the file still starts with the hashed bytes (first and last block)."""
+        if self.size > os.path.getsize(filename):
+            return False
+        if not self.hashes:
+            return self.size == 0
+        last = len(self.hashes) - 1
+        with open(filename, "rb") as f:
+            for block in sorted({0, last}):
+                f.seek(block * HASH_BLOCK)
+                digest = hashlib.sha256(f.read(min(HASH_BLOCK, self.size - block * HASH_BLOCK)))
+                if digest.hexdigest() != self.hashes[block]:
+                    return False
+        if self.size % HASH_BLOCK:
+            self.tail = digest
+        return True
+
+    def extend(self, filename: str, end: int) -> None:
+        """Adds the bytes from size to end of the file to the hashes (size is end afterwards)."""
+        if end <= self.size:
+            return
+        with open(filename, "rb") as f:
+            if self.size % HASH_BLOCK == 0:
+                self.tail = hashlib.sha256()
+            else:
+                if self.tail is None:
+                    block_start = self.size - self.size % HASH_BLOCK
+                    f.seek(block_start)
+                    self.tail = hashlib.sha256(f.read(self.size - block_start))
+                self.hashes.pop()  # the partial block grows
+            f.seek(self.size)
+            while self.size < end:
+                chunk = f.read(min(HASH_BLOCK - self.size % HASH_BLOCK, end - self.size))
+                if not chunk:
+                    break  # the file was truncated; size tells how far it got
+                self.tail.update(chunk)
+                self.size += len(chunk)
+                if self.size % HASH_BLOCK == 0:
+                    self.hashes.append(self.tail.hexdigest())
+                    self.tail = hashlib.sha256()
+            if self.size % HASH_BLOCK:
+                self.hashes.append(self.tail.hexdigest())
@@ -1,13 +1,36 @@
 # Copyright (c) 2026 Jony Ahammad
 # License: MIT
 
-from datetime import datetime
-from typing import List
+import argparse
+import os
+import sys
+from array import array
+from bisect import bisect_left, insort
+from copy import copy
+from datetime import datetime, date, timedelta
+from heapq import heappop, heappush
+from itertools import chain
+from random import random
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+# The helpers shared by the tasks are in task_common.py at the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from task_common import (
+    ReportWriter, format_date_fi, format_time_fi, load_many, parse_date, parse_time,
+    profiler_from_env
+)
+
+
+PROFILER = profiler_from_env()
 
 
 class Reservation:
     """Represents a reservation."""
 
+    # No per-instance __dict__: large reservation lists use much less memory
+    __slots__ = ("reservation_id", "name", "email", "phone", "date", "time",
+                 "duration", "price", "confirmed", "resource", "created")
+
     def __init__(self, reservation_id, name, email, phone,
                  date, time, duration, price,
                  confirmed, resource, created):
@@ -36,6 +59,445 @@ class Reservation:
         """Calculates total price of the reservation."""
         return self.duration * self.price
 
+    def start(self) -> datetime:
+        """Returns the date and time the reservation starts."""
+        return datetime.combine(self.date, self.time)
+
+    def end(self) -> datetime:
+        """Returns the date and time the reservation ends."""
+        return self.start() + timedelta(hours=self.duration)
+
+
+class _Booking:
+    """A node of the ResourceSchedule treap."""
+
+    __slots__ = ("key", "priority", "left", "right", "max_end")
+
+    def __init__(self, key: tuple):
+        self.key = key  # (start, end, reservation_id)
+        self.priority = random()
+        self.left: Optional["_Booking"] = None
+        self.right: Optional["_Booking"] = None
+        self.max_end: datetime = key[1]
+
+    def update(self) -> "_Booking":
+        """Recomputes the latest end time of this subtree from the children."""
+        max_end = self.key[1]
+        if self.left is not None and self.left.max_end > max_end:
+            max_end = self.left.max_end
+        if self.right is not None and self.right.max_end > max_end:
+            max_end = self.right.max_end
+        self.max_end = max_end
+        return self
+
+
+class ResourceSchedule:
+    """
+    The bookings of one resource as (start, end, reservation_id) keys in a treap
+    (a randomly balanced search tree) ordered by start. Every node also holds
+    the latest end time of its subtree, so is_free(), add() and remove() each
+    walk one root-to-leaf path: O(log n) expected.
+    """
+
+    def __init__(self, bookings: Iterable[tuple] = ()):
+        self._root: Optional[_Booking] = None
+        self._size = 0
+        # Build the treap from the sorted keys in one pass (a Cartesian tree)
+        stack: List[_Booking] = []
+        for key in sorted(bookings):
+            node = _Booking(key)
+            last = None
+            while stack and stack[-1].priority < node.priority:
+                last = stack.pop().update()
+            node.left = last
+            if stack:
+                stack[-1].right = node
+            stack.append(node)
+            self._size += 1
+        for node in reversed(stack):
+            node.update()
+        if stack:
+            self._root = stack[0]
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[tuple]:
+        """Yields the booking keys in start order."""
+        stack = []
+        node = self._root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.key
+            node = node.right
+
+    def add(self, start: datetime, end: datetime, reservation_id: int) -> None:
+        """Adds a booking."""
+        self._root = self._insert(self._root, _Booking((start, end, reservation_id)))
+        self._size += 1
+
+    def _insert(self, node: Optional[_Booking], new: _Booking) -> _Booking:
+        if node is None:
+            return new
+        if new.priority > node.priority:
+            new.left, new.right = self._split(node, new.key)
+            return new.update()
+        if new.key < node.key:
+            node.left = self._insert(node.left, new)
+        else:
+            node.right = self._insert(node.right, new)
+        return node.update()
+
+    def _split(self, node: Optional[_Booking], key: tuple) -> Tuple[Optional[_Booking], Optional[_Booking]]:
+        """Splits a subtree into the keys below key and the rest."""
+        if node is None:
+            return None, None
+        if node.key < key:
+            node.right, rest = self._split(node.right, key)
+            return node.update(), rest
+        below, node.left = self._split(node.left, key)
+        return below, node.update()
+
+    def _merge(self, left: Optional[_Booking], right: Optional[_Booking]) -> Optional[_Booking]:
+        """Joins two subtrees where every key of left is below every key of right."""
+        if left is None:
+            return right
+        if right is None:
+            return left
+        if left.priority > right.priority:
+            left.right = self._merge(left.right, right)
+            return left.update()
+        right.left = self._merge(left, right.left)
+        return right.update()
+
+    def remove(self, start: datetime, end: datetime, reservation_id: int) -> None:
+        """Removes a booking."""
+        self._root = self._delete(self._root, (start, end, reservation_id))
+        self._size -= 1
+
+    def _delete(self, node: Optional[_Booking], key: tuple) -> Optional[_Booking]:
+        if node is None:
+            raise KeyError(key)
+        if key == node.key:
+            return self._merge(node.left, node.right)
+        if key < node.key:
+            node.left = self._delete(node.left, key)
+        else:
+            node.right = self._delete(node.right, key)
+        return node.update()
+
+    def is_free(self, start: datetime, end: datetime) -> bool:
+        """Returns True if no booking overlaps the time from start to end."""
+        # The latest end time of the bookings that start before end
+        latest = None
+        node = self._root
+        while node is not None:
+            if node.key[0] < end:
+                if latest is None or node.key[1] > latest:
+                    latest = node.key[1]
+                if node.left is not None and node.left.max_end > latest:
+                    latest = node.left.max_end
+                node = node.right
+            else:
+                node = node.left
+        return latest is None or latest <= start
+
+    def conflicts(self) -> Iterator[Tuple[int, int]]:
+        """
+        Yields the ids of every pair of overlapping bookings. The bookings are
+        swept in start order, keeping a heap of the ones still running, so the
+        cost is O(n log n) plus one step per conflict found.
+        """
+        running = []  # (end, reservation_id)
+        for start, end, reservation_id in self:
+            while running and running[0][0] <= start:
+                heappop(running)
+            for _, other_id in running:
+                yield other_id, reservation_id
+            heappush(running, (end, reservation_id))
+
+
+class RevenueCube:
+    """
+    Revenue (in cents) and booked hours per resource, day and confirmation
+    status. cells[resource][confirmed] holds a revenue and an hours array with
+    one slot per day from first_day on, so slices and week/month roll-ups are
+    summed from the arrays without going back to the reservations.
+    """
+
+    MEASURES = ("revenue", "hours")
+
+    def __init__(self, reservations: Iterable[Reservation] = ()):
+        self.first_day: Optional[int] = None  # ordinal of the first slot
+        self.days = 0
+        self.cells: Dict[str, List[Tuple[array, array]]] = {}
+        for reservation in reservations:
+            self.add(reservation)
+
+    def _slot(self, day: date) -> int:
+        """Returns the array slot of a day, growing every array to cover it."""
+        ordinal = day.toordinal()
+        if self.first_day is None:
+            self.first_day = ordinal
+        if ordinal < self.first_day:
+            padding = array("q", [0]) * (self.first_day - ordinal)
+            for cell in self.cells.values():
+                for values in (*cell[0], *cell[1]):
+                    values[0:0] = padding
+            self.days += len(padding)
+            self.first_day = ordinal
+        elif ordinal >= self.first_day + self.days:
+            padding = array("q", [0]) * (ordinal - self.first_day - self.days + 1)
+            for cell in self.cells.values():
+                for values in (*cell[0], *cell[1]):
+                    values.extend(padding)
+            self.days += len(padding)
+        return ordinal - self.first_day
+
+    @staticmethod
+    def amounts(reservation: Reservation) -> array:
+        """
+        Returns the revenue (cents) and booked hours a reservation adds to its day.
+        Raises TypeError if they are not whole numbers the arrays can hold.
+        """
+        return array("q", (round(reservation.price * 100) * reservation.duration, reservation.duration))
+
+    def _apply(self, reservation: Reservation, sign: int) -> None:
+        revenue_cents, booked_hours = self.amounts(reservation)
+        slot = self._slot(reservation.date)
+        cell = self.cells.get(reservation.resource)
+        if cell is None:
+            cell = self.cells[reservation.resource] = [
+                (array("q", [0]) * self.days, array("q", [0]) * self.days) for _ in range(2)]
+        revenue, hours = cell[bool(reservation.confirmed)]
+        revenue[slot] += sign * revenue_cents
+        hours[slot] += sign * booked_hours
+
+    def add(self, reservation: Reservation) -> None:
+        """Adds a reservation to the totals."""
+        self._apply(reservation, 1)
+
+    def remove(self, reservation: Reservation) -> None:
+        """Takes a reservation out of the totals."""
+        self._apply(reservation, -1)
+
+    def _arrays(self, measure: str, resource: Optional[str], confirmed: Optional[bool]) -> List[array]:
+        """Returns the day arrays of the cells selected by resource and confirmed."""
+        if measure not in self.MEASURES:
+            raise ValueError(f"Unknown measure {measure!r}")
+        index = self.MEASURES.index(measure)
+        if resource is None:
+            cells = list(self.cells.values())
+        else:
+            cells = [self.cells[resource]] if resource in self.cells else []
+        statuses = (False, True) if confirmed is None else (confirmed,)
+        return [cell[status][index] for cell in cells for status in statuses]
+
+    @staticmethod
+    def _value(measure: str, total: int) -> float:
+        return total / 100 if measure == "revenue" else total
+
+    def resources(self) -> List[str]:
+        """Returns the resources with reservations."""
+        return sorted(self.cells)
+
+    def total(self, measure: str = "revenue", resource: str = None, confirmed: bool = None,
+              start: date = None, end: date = None) -> float:
+        """
+        Returns the revenue (euros) or booked hours of a slice: one resource or
+        all, confirmed, not confirmed or both, from start to end (inclusive).
+        """
+        if self.first_day is None:
+            return 0
+        low = 0 if start is None else max(0, start.toordinal() - self.first_day)
+        high = self.days if end is None else max(0, end.toordinal() - self.first_day + 1)
+        total = sum(sum(values[low:high]) for values in self._arrays(measure, resource, confirmed))
+        return self._value(measure, total)
+
+    def rollup(self, period: str = "month", measure: str = "revenue", resource: str = None,
+               confirmed: bool = None) -> Dict:
+        """
+        Returns the revenue or booked hours of a slice per day (date keys), week
+        ((ISO year, week) keys) or month ((year, month) keys).
+        """
+        if period == "day":
+            bucket = lambda day: day
+        elif period == "week":
+            bucket = lambda day: tuple(day.isocalendar()[:2])
+        elif period == "month":
+            bucket = lambda day: (day.year, day.month)
+        else:
+            raise ValueError(f"Unknown period {period!r}")
+        arrays = self._arrays(measure, resource, confirmed)
+        totals = {}
+        for slot, values in enumerate(zip(*arrays)):
+            key = bucket(date.fromordinal(self.first_day + slot))
+            totals[key] = totals.get(key, 0) + sum(values)
+        return {key: self._value(measure, total) for key, total in totals.items()}
+
+
+class ReservationStore:
+    """
+    Keeps reservations indexed by id, resource, start date/time and confirmation,
+    so lookups do not have to scan every reservation. Each resource also has a
+    ResourceSchedule for double-booking checks, and a RevenueCube keeps the
+    revenue and booked-hours totals up to date.
+    """
+
+    def __init__(self, reservations: Iterable[Reservation] = ()):
+        self._by_id: Dict[int, Reservation] = {}
+        self._by_resource: Dict[str, Dict[int, Reservation]] = {}
+        self._by_start: List[tuple] = []  # sorted (date, time, reservation_id)
+        self._confirmed: Dict[int, Reservation] = {}
+        self._schedules: Dict[str, ResourceSchedule] = {}
+        self._cube = RevenueCube()
+        for reservation in reservations:
+            self._index(reservation)
+        self._by_start.sort()
+        for resource, by_id in self._by_resource.items():
+            self._schedules[resource] = ResourceSchedule(
+                (r.start(), r.end(), r.reservation_id) for r in by_id.values())
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __iter__(self) -> Iterator[Reservation]:
+        return iter(self._by_id.values())
+
+    def _index(self, reservation: Reservation) -> None:
+        """Adds a reservation to every index except the sorted start index."""
+        if reservation.reservation_id in self._by_id:
+            raise ValueError(f"Duplicate reservation id {reservation.reservation_id}")
+        self._by_id[reservation.reservation_id] = reservation
+        self._by_resource.setdefault(reservation.resource, {})[reservation.reservation_id] = reservation
+        self._by_start.append((reservation.date, reservation.time, reservation.reservation_id))
+        if reservation.confirmed:
+            self._confirmed[reservation.reservation_id] = reservation
+        self._cube.add(reservation)
+
+    def _schedule(self, reservation: Reservation) -> None:
+        schedule = self._schedules.setdefault(reservation.resource, ResourceSchedule())
+        schedule.add(reservation.start(), reservation.end(), reservation.reservation_id)
+
+    def _unschedule(self, reservation: Reservation) -> None:
+        schedule = self._schedules[reservation.resource]
+        schedule.remove(reservation.start(), reservation.end(), reservation.reservation_id)
+        if not schedule:
+            del self._schedules[reservation.resource]
+
+    def _unindex(self, reservation: Reservation) -> None:
+        """Takes a reservation out of every index except its schedule."""
+        reservation_id = reservation.reservation_id
+        del self._by_id[reservation_id]
+        resource = self._by_resource[reservation.resource]
+        del resource[reservation_id]
+        if not resource:
+            del self._by_resource[reservation.resource]
+        key = (reservation.date, reservation.time, reservation_id)
+        del self._by_start[bisect_left(self._by_start, key)]
+        self._confirmed.pop(reservation_id, None)
+        self._cube.remove(reservation)
+
+    def _insert(self, reservation: Reservation) -> None:
+        """Adds a reservation to every index except its schedule."""
+        self._index(reservation)
+        self._by_start.pop()
+        insort(self._by_start, (reservation.date, reservation.time, reservation.reservation_id))
+
+    def add(self, reservation: Reservation) -> None:
+        """Adds a new reservation."""
+        self._insert(reservation)
+        self._schedule(reservation)
+
+    def remove(self, reservation_id: int) -> Reservation:
+        """Removes a reservation and returns it."""
+        reservation = self._by_id[reservation_id]
+        self._unschedule(reservation)
+        self._unindex(reservation)
+        return reservation
+
+    # Attributes that place a reservation in its resource schedule
+    SCHEDULE_FIELDS = ("date", "time", "duration", "resource")
+
+    @staticmethod
+    def _check(changed: Reservation, original: Reservation) -> None:
+        """
+        Raises TypeError if a changed copy of a reservation could not be indexed
+        like the original, so update() fails before it changes anything. Every
+        index key is computed and compared with the original one.
+        """
+        hash(changed.resource)
+        _ = (changed.date, changed.time) < (original.date, original.time)
+        _ = (changed.start(), changed.end()) < (original.start(), original.end())
+        changed.date.toordinal()
+        RevenueCube.amounts(changed)
+
+    def update(self, reservation_id: int, **changes) -> Reservation:
+        """
+        Changes attributes of a reservation (e.g. confirmed=True) and re-indexes
+        it. The changes are checked on a copy first; if they are invalid the
+        store is left as it was. The resource schedule is only touched if the
+        time or resource changes.
+        """
+        reservation = self._by_id[reservation_id]
+        for name in changes:
+            if not hasattr(reservation, name):
+                raise AttributeError(f"Reservation has no attribute {name!r}")
+        changed = copy(reservation)
+        for name, value in changes.items():
+            setattr(changed, name, value)
+        self._check(changed, reservation)
+        moved = any(changes[name] != getattr(reservation, name)
+                    for name in self.SCHEDULE_FIELDS if name in changes)
+        if moved:
+            self._unschedule(reservation)
+        self._unindex(reservation)
+        for name, value in changes.items():
+            setattr(reservation, name, value)
+        self._insert(reservation)
+        if moved:
+            self._schedule(reservation)
+        return reservation
+
+    def get(self, reservation_id: int) -> Optional[Reservation]:
+        """Returns the reservation with the given id, or None."""
+        return self._by_id.get(reservation_id)
+
+    def by_resource(self, resource: str) -> List[Reservation]:
+        """Returns the reservations of one resource."""
+        return list(self._by_resource.get(resource, {}).values())
+
+    def between(self, start_date: date, end_date: date) -> List[Reservation]:
+        """Returns the reservations from start_date to end_date (inclusive) in start order."""
+        start = bisect_left(self._by_start, (start_date,))
+        end = bisect_left(self._by_start, (end_date + timedelta(days=1),))
+        return [self._by_id[key[2]] for key in self._by_start[start:end]]
+
+    def confirmed(self) -> List[Reservation]:
+        """Returns the confirmed reservations."""
+        return list(self._confirmed.values())
+
+    def cube(self) -> RevenueCube:
+        """Returns the revenue and booked-hours rollups of the reservations."""
+        return self._cube
+
+    def is_free(self, resource: str, start: datetime, end: datetime) -> bool:
+        """Returns True if the resource has no reservation overlapping start to end."""
+        schedule = self._schedules.get(resource)
+        return schedule is None or schedule.is_free(start, end)
+
+    def conflicts(self, resource: str = None) -> Iterator[Tuple[Reservation, Reservation]]:
+        """Yields every pair of reservations of the same resource that overlap in time."""
+        resources = list(self._schedules) if resource is None else [resource]
+        for name in resources:
+            if name not in self._schedules:
+                continue
+            for first_id, second_id in self._schedules[name].conflicts():
+                yield self._by_id[first_id], self._by_id[second_id]
+
 
 def convert_reservation(data: List[str]) -> Reservation:
     """Converts list data into a Reservation object."""
@@ -45,8 +507,8 @@ def convert_reservation(data: List[str]) -> Reservation:
         name=data[1],
         email=data[2],
         phone=data[3],
-        date=datetime.strptime(data[4], "%Y-%m-%d").date(),
-        time=datetime.strptime(data[5], "%H:%M").time(),
+        date=parse_date(data[4]),
+        time=parse_time(data[5]),
         duration=int(data[6]),
         price=float(data[7]),
         confirmed=data[8].lower() == "true",
@@ -55,6 +517,7 @@ def convert_reservation(data: List[str]) -> Reservation:
     )
 
 
+@PROFILER.measure("fetch_reservations", rows=lambda reservations, *args: len(reservations))
 def fetch_reservations(filename: str) -> List[Reservation]:
     """Reads reservations and returns a list of Reservation objects."""
     reservations = []
@@ -70,28 +533,33 @@ def fetch_reservations(filename: str) -> List[Reservation]:
     return reservations
 
 
+@PROFILER.measure("print_confirmed", rows=lambda result, reservations: len(reservations))
 def print_confirmed(reservations: List[Reservation]) -> None:
     """Prints confirmed reservations."""
-    print("\nConfirmed reservations:")
+    with ReportWriter() as writer:
+        writer.write_line("\nConfirmed reservations:")
 
-    for reservation in reservations:
-        if reservation.is_confirmed():
-            print(
-                f"- {reservation.name}, {reservation.resource}, "
-                f"{reservation.date.strftime('%d.%m.%Y')} at {reservation.time.strftime('%H.%M')}"
-            )
+        for reservation in reservations:
+            if reservation.is_confirmed():
+                writer.write_line(
+                    f"- {reservation.name}, {reservation.resource}, "
+                    f"{format_date_fi(reservation.date)} at {format_time_fi(reservation.time)}"
+                )
 
 
+@PROFILER.measure("print_long_reservations", rows=lambda result, reservations: len(reservations))
 def print_long_reservations(reservations: List[Reservation]) -> None:
     """Prints reservations lasting 3 hours or more."""
 
-    print("\nLong reservations (>=3 hours):")
+    with ReportWriter() as writer:
+        writer.write_line("\nLong reservations (>=3 hours):")
 
-    for reservation in reservations:
-        if reservation.is_long():
-            print(f"- {reservation.name} ({reservation.duration} hours)")
+        for reservation in reservations:
+            if reservation.is_long():
+                writer.write_line(f"- {reservation.name} ({reservation.duration} hours)")
 
 
+@PROFILER.measure("calculate_total_revenue", rows=lambda result, reservations: len(reservations))
 def calculate_total_revenue(reservations: List[Reservation]) -> None:
     """Calculates total revenue."""
 
@@ -103,14 +571,26 @@ def calculate_total_revenue(reservations: List[Reservation]) -> None:
     print(f"\nTotal revenue: {total:.2f} €")
 
 
+def parse_args() -> argparse.Namespace:
+    """Parses the command line options."""
+    parser = argparse.ArgumentParser(description="Reservation reports")
+    parser.add_argument("files", nargs="*", default=["reservations.txt"],
+                        help="reservation files, read concurrently (default reservations.txt)")
+    return parser.parse_args()
+
+
 def main() -> None:
     """Main function."""
 
-    reservations = fetch_reservations("reservations.txt")
+    args = parse_args()
+    reservations = list(chain.from_iterable(load_many(fetch_reservations, args.files)))
+    with PROFILER.stage("ReservationStore") as record:
+        store = ReservationStore(reservations)
+        record["rows"] = len(store)
 
-    print_confirmed(reservations)
-    print_long_reservations(reservations)
-    calculate_total_revenue(reservations)
+    print_confirmed(store.confirmed())
+    print_long_reservations(list(store))
+    calculate_total_revenue(list(store))
 
 
 if __name__ == "__main__":
@@ -1,8 +1,22 @@
 # Copyright (c) 2026 Jony Ahammad
 # License: MIT
 
+import argparse
+import os
+import sys
 from datetime import datetime
-from typing import List, Dict
+from itertools import chain
+from typing import Dict, List
+
+# The helpers shared by the tasks are in task_common.py at the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from task_common import (
+    ReportWriter, format_date_fi, format_time_fi, load_many, parse_date, parse_time,
+    profiler_from_env
+)
+
+
+PROFILER = profiler_from_env()
 
 
 def convert_reservation(data: List[str]) -> Dict:
@@ -12,8 +26,8 @@ def convert_reservation(data: List[str]) -> Dict:
         "name": data[1],
         "email": data[2],
         "phone": data[3],
-        "date": datetime.strptime(data[4], "%Y-%m-%d").date(),
-        "time": datetime.strptime(data[5], "%H:%M").time(),
+        "date": parse_date(data[4]),
+        "time": parse_time(data[5]),
         "duration": int(data[6]),
         "price": float(data[7]),
         "confirmed": data[8].lower() == "true",
@@ -22,6 +36,7 @@ def convert_reservation(data: List[str]) -> Dict:
     }
 
 
+@PROFILER.measure("fetch_reservations", rows=lambda reservations, *args: len(reservations))
 def fetch_reservations(filename: str) -> List[Dict]:
     """Reads reservations from a file and returns them as dictionaries."""
     reservations = []
@@ -37,25 +52,30 @@ def fetch_reservations(filename: str) -> List[Dict]:
     return reservations
 
 
+@PROFILER.measure("print_confirmed", rows=lambda result, reservations: len(reservations))
 def print_confirmed(reservations: List[Dict]) -> None:
     """Prints confirmed reservations."""
-    print("\nConfirmed reservations:")
-    for reservation in reservations:
-        if reservation["confirmed"]:
-            print(
-                f"- {reservation['name']}, {reservation['resource']}, "
-                f"{reservation['date'].strftime('%d.%m.%Y')} at {reservation['time'].strftime('%H.%M')}"
-            )
+    with ReportWriter() as writer:
+        writer.write_line("\nConfirmed reservations:")
+        for reservation in reservations:
+            if reservation["confirmed"]:
+                writer.write_line(
+                    f"- {reservation['name']}, {reservation['resource']}, "
+                    f"{format_date_fi(reservation['date'])} at {format_time_fi(reservation['time'])}"
+                )
 
 
+@PROFILER.measure("print_long_reservations", rows=lambda result, reservations: len(reservations))
 def print_long_reservations(reservations: List[Dict]) -> None:
     """Prints reservations lasting 3 hours or more."""
-    print("\nLong reservations (>=3 hours):")
-    for reservation in reservations:
-        if reservation["duration"] >= 3:
-            print(f"- {reservation['name']} ({reservation['duration']} hours)")
+    with ReportWriter() as writer:
+        writer.write_line("\nLong reservations (>=3 hours):")
+        for reservation in reservations:
+            if reservation["duration"] >= 3:
+                writer.write_line(f"- {reservation['name']} ({reservation['duration']} hours)")
 
 
+@PROFILER.measure("calculate_total_revenue", rows=lambda result, reservations: len(reservations))
 def calculate_total_revenue(reservations: List[Dict]) -> None:
     """Calculates and prints total revenue."""
     total = 0
@@ -65,9 +85,18 @@ def calculate_total_revenue(reservations: List[Dict]) -> None:
     print(f"\nTotal revenue: {total:.2f} €")
 
 
+def parse_args() -> argparse.Namespace:
+    """Parses the command line options."""
+    parser = argparse.ArgumentParser(description="Reservation reports")
+    parser.add_argument("files", nargs="*", default=["reservations.txt"],
+                        help="reservation files, read concurrently (default reservations.txt)")
+    return parser.parse_args()
+
+
 def main() -> None:
     """Main program."""
-    reservations = fetch_reservations("reservations.txt")
+    args = parse_args()
+    reservations = list(chain.from_iterable(load_many(fetch_reservations, args.files)))
 
     print_confirmed(reservations)
     print_long_reservations(reservations)
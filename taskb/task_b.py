@@ -1,5 +1,12 @@
+import argparse
+import os
+import sys
 from datetime import datetime
 
+# The helpers shared by the tasks are in task_common.py at the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from task_common import format_decimal_fi, print_slips, read_reservations
+
 def print_reservation_number(reservation: list) -> None:
     # Prints the reservation number
     number = int(reservation[0])
@@ -30,7 +37,7 @@ def print_hours(reservation: list) -> None:
 def print_hourly_rate(reservation: list) -> None:
     # Prints hourly rate
     rate = float(reservation[5])
-    rate_str = f"{rate:.2f}".replace('.', ',')
+    rate_str = format_decimal_fi(rate)
     print(f"Hourly rate: {rate_str} €")
 
 def print_total_price(reservation: list) -> None:
@@ -38,7 +45,7 @@ def print_total_price(reservation: list) -> None:
     hours = int(reservation[4])
     rate = float(reservation[5])
     total = hours * rate
-    total_str = f"{total:.2f}".replace('.', ',')
+    total_str = format_decimal_fi(total)
     print(f"Total price: {total_str} €")
 
 def print_paid(reservation: list) -> None:
@@ -61,9 +68,37 @@ def print_email(reservation: list) -> None:
     email = reservation[9]
     print(f"Email: {email}")
 
+# Confirmation slip, the same text main prints for one reservation (the
+# --batch mode fills it with task_common.render_slip)
+SLIP_TEMPLATE = (
+    "Reservation number: {number}\n"
+    "Booker: {booker}\n"
+    "Date: {date}\n"
+    "Start time: {start_time}\n"
+    "Number of hours: {hours}\n"
+    "Hourly rate: {price} €\n"
+    "Total price: {total} €\n"
+    "Paid: {paid}\n"
+    "Venue: {location}\n"
+    "Phone: {phone}\n"
+    "Email: {email}"
+)
+
+def parse_args() -> argparse.Namespace:
+    # Parses the command line options
+    parser = argparse.ArgumentParser(description="Print reservation confirmation slips")
+    parser.add_argument("--batch", metavar="FILE",
+                        help="print a slip for every reservation in FILE")
+    return parser.parse_args()
+
 def main():
     """Reads reservation data from a file and prints it using functions"""
 
+    args = parse_args()
+    if args.batch:
+        print_slips(read_reservations(args.batch), SLIP_TEMPLATE)
+        return
+
     filename = "reservations.txt"
 
     with open(filename, "r", encoding="utf-8") as f: